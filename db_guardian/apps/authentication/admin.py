@@ -4,6 +4,7 @@
 为用户、角色、权限、团队等模型提供后台管理界面。
 """
 from django.contrib import admin
+from django.db.models import Count
 from django.contrib.auth.models import Group, Permission as DjangoPermission
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
@@ -107,10 +108,16 @@ class RoleAdmin(admin.ModelAdmin):
     filter_horizontal = ['permissions']
     readonly_fields = ['created_at']
     
+    def get_queryset(self, request):
+        # 列表页一次聚合权限数量，避免逐行 COUNT。
+        return super().get_queryset(request).annotate(_permission_count=Count('permissions'))
+    
     def permission_count(self, obj):
         """显示权限数量"""
-        return obj.permissions.count()
+        count = getattr(obj, '_permission_count', None)
+        return obj.permissions.count() if count is None else count
     permission_count.short_description = _('权限数量')
+    permission_count.admin_order_field = '_permission_count'
     
     def get_readonly_fields(self, request, obj=None):
         """内置角色的 slug 和 is_builtin 字段只读"""
@@ -162,10 +169,18 @@ class TeamAdmin(admin.ModelAdmin):
     
     readonly_fields = ['created_at', 'updated_at']
     
+    def get_queryset(self, request):
+        # 列表页一次关联所有者并聚合成员数量，避免逐行查询。
+        return super().get_queryset(request).select_related('owner').annotate(
+            _member_count=Count('memberships')
+        )
+    
     def member_count(self, obj):
         """显示成员数量"""
-        return obj.memberships.count()
+        count = getattr(obj, '_member_count', None)
+        return obj.memberships.count() if count is None else count
     member_count.short_description = _('成员数量')
+    member_count.admin_order_field = '_member_count'
     
     list_per_page = 20
 
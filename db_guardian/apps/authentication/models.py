@@ -87,6 +87,19 @@ class User(AbstractUser):
         """
         return self.team_memberships.select_related('team', 'role')
     
+    def get_team_ids(self):
+        """
+        获取用户所属团队的 ID 列表
+        
+        结果缓存在当前用户对象上，同一请求内的多次过滤/权限检查只查询一次。
+        
+        Returns:
+            list: 团队 ID 列表
+        """
+        if not hasattr(self, '_team_ids'):
+            self._team_ids = list(self.teams.values_list('id', flat=True))
+        return self._team_ids
+    
     def has_team_permission(self, team, permission_slug):
         """
         检查用户在指定团队是否拥有某个权限
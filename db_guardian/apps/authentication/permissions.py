@@ -75,18 +75,21 @@ class IsTeamMember(permissions.BasePermission):
         if request.user.is_superuser:
             return True
         
-        # 获取团队对象
-        team = None
-        if hasattr(obj, 'team'):
-            # 如果对象有 team 属性（如 Instance, Backup 等）
-            team = obj.team
+        # 获取团队 ID（直接读外键列，不加载团队对象）
+        team_id = None
+        if hasattr(obj, 'team_id'):
+            # 如果对象有 team 外键（如 Instance）
+            team_id = obj.team_id
         elif hasattr(obj, 'members'):
             # 如果对象本身就是 Team
-            team = obj
+            team_id = obj.id
+        elif hasattr(obj, 'instance'):
+            # 如果对象挂在实例下（如备份策略、备份记录、数据库）
+            team_id = obj.instance.team_id
         
-        if team:
+        if team_id:
             # 检查用户是否为团队成员
-            return team.members.filter(id=request.user.id).exists()
+            return team_id in request.user.get_team_ids()
         
         return False
 
@@ -1,3 +1,86 @@
+from types import SimpleNamespace
+
 from django.test import TestCase
 
-# 在此编写测试用例。
+from apps.authentication.models import Role, Team, TeamMember, User
+from apps.authentication.permissions import IsTeamMember
+from apps.backups.models import BackupOneOffTask, BackupRecord, BackupStrategy
+from apps.instances.models import Database, MySQLInstance
+
+
+class IsTeamMemberObjectPermissionTests(TestCase):
+    """IsTeamMember 对象级权限的允许/拒绝矩阵"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('owner', 'owner@example.com', 'pw')
+        cls.member = User.objects.create_user('member', 'member@example.com', 'pw')
+        cls.outsider = User.objects.create_user('outsider', 'outsider@example.com', 'pw')
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+        cls.team = Team.objects.create(name='team-a', owner=cls.owner)
+        cls.other_team = Team.objects.create(name='team-b', owner=cls.owner)
+        role = Role.objects.create(name='成员', slug='test-member')
+        TeamMember.objects.create(user=cls.member, team=cls.team, role=role)
+
+        cls.instance = MySQLInstance.objects.create(
+            alias='db-a', host='10.0.0.1', port=3306, username='root',
+            password='pw', team=cls.team, created_by=cls.owner
+        )
+        cls.other_instance = MySQLInstance.objects.create(
+            alias='db-b', host='10.0.0.2', port=3306, username='root',
+            password='pw', team=cls.other_team, created_by=cls.owner
+        )
+
+    def _allowed(self, user, obj):
+        request = SimpleNamespace(user=user)
+        return IsTeamMember().has_object_permission(request, None, obj)
+
+    def _instance_bound_objects(self, instance):
+        return [
+            BackupStrategy(instance=instance),
+            BackupRecord(instance=instance),
+            BackupOneOffTask(instance=instance),
+            Database(instance=instance),
+        ]
+
+    def test_superuser_allowed_everywhere(self):
+        objects = [self.team, self.other_instance] + self._instance_bound_objects(self.other_instance)
+        for obj in objects:
+            with self.subTest(obj=type(obj).__name__):
+                self.assertTrue(self._allowed(self.admin, obj))
+
+    def test_member_allowed_on_own_team_and_instance(self):
+        self.assertTrue(self._allowed(self.member, self.team))
+        self.assertTrue(self._allowed(self.member, self.instance))
+
+    def test_member_denied_on_other_team_and_instance(self):
+        self.assertFalse(self._allowed(self.member, self.other_team))
+        self.assertFalse(self._allowed(self.member, self.other_instance))
+
+    def test_member_allowed_on_objects_under_own_instance(self):
+        # 策略、记录、一次性任务、数据库经所属实例解析团队（此前一律拒绝）。
+        for obj in self._instance_bound_objects(self.instance):
+            with self.subTest(obj=type(obj).__name__):
+                self.assertTrue(self._allowed(self.member, obj))
+
+    def test_member_denied_on_objects_under_other_instance(self):
+        for obj in self._instance_bound_objects(self.other_instance):
+            with self.subTest(obj=type(obj).__name__):
+                self.assertFalse(self._allowed(self.member, obj))
+
+    def test_outsider_denied(self):
+        objects = [self.team, self.instance] + self._instance_bound_objects(self.instance)
+        for obj in objects:
+            with self.subTest(obj=type(obj).__name__):
+                self.assertFalse(self._allowed(self.outsider, obj))
+
+    def test_object_without_team_denied(self):
+        self.assertFalse(self._allowed(self.member, SimpleNamespace()))
+
+    def test_team_row_not_loaded(self):
+        user = User.objects.get(pk=self.member.pk)
+        user.get_team_ids()
+        instance = MySQLInstance.objects.get(pk=self.instance.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(self._allowed(user, instance))
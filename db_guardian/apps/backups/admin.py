@@ -6,13 +6,12 @@
 import json
 import datetime
 import logging
-from uuid import uuid4
 from django.contrib import admin, messages
 from django.http import HttpResponseRedirect, FileResponse, JsonResponse
-from django.conf import settings
 from django.template.response import TemplateResponse
 from django import forms
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django.utils import timezone
 from django.urls import reverse, path
 from django.shortcuts import get_object_or_404
@@ -24,13 +23,15 @@ from apps.backups.models import (
     BackupTaskBoard,
     BackupRestoreBoard
 )
-from apps.backups.tasks import execute_backup_task, execute_oneoff_backup_task
+from apps.backups.tasks import execute_backup_task, execute_oneoff_backup_task, purge_backup_records
 from apps.backups.services import (
     StrategyManager,
     RemoteExecutor,
     RemoteStorageClient,
     ObjectStorageUploader,
-    RestoreExecutor
+    RestoreExecutor,
+    build_sendfile_response,
+    prepare_backup_download_path,
 )
 from apps.instances.models import MySQLInstance
 
@@ -50,6 +51,39 @@ except Exception:
     SolarSchedule = None
     ClockedSchedule = None
 
+# 状态徽章在导入时按选项预渲染，列表逐行直接查表，不再调用 format_html。
+_STATUS_BADGE_TEMPLATE = '<span style="color: {}; font-weight: bold;">{}</span>'
+_STATUS_COLORS = {
+    'pending': 'gray',
+    'running': 'blue',
+    'success': 'green',
+    'failed': 'red',
+    'canceled': 'orange',
+}
+_ENABLED_BADGES = {
+    True: mark_safe('<span style="color: green; font-weight: bold;">✓ 启用</span>'),
+    False: mark_safe('<span style="color: red;">✗ 禁用</span>'),
+}
+
+
+def _prerender_status_badges(choices):
+    return {
+        value: format_html(_STATUS_BADGE_TEMPLATE, _STATUS_COLORS.get(value, 'gray'), label)
+        for value, label in choices
+    }
+
+
+def _status_badge(badges, obj):
+    """查表返回状态徽章，未知状态才即时渲染。"""
+    badge = badges.get(obj.status)
+    if badge is None:
+        badge = format_html(_STATUS_BADGE_TEMPLATE, 'gray', obj.get_status_display())
+    return badge
+
+
+_RECORD_STATUS_BADGES = _prerender_status_badges(BackupRecord.STATUS_CHOICES)
+_ONEOFF_STATUS_BADGES = _prerender_status_badges(BackupOneOffTask.STATUS_CHOICES)
+
 
 def _parse_int(value, default=None):
     try:
@@ -453,7 +487,8 @@ class BackupStrategyAdmin(admin.ModelAdmin):
                 'cron_expression',
                 'backup_type',
                 'retention_days',
-                'compress'
+                'compress',
+                'compression_algo'
             )
         }),
         ('存储设置', {
@@ -485,13 +520,7 @@ class BackupStrategyAdmin(admin.ModelAdmin):
     
     def is_enabled_badge(self, obj):
         """显示启用状态徽章"""
-        if obj.is_enabled:
-            return format_html(
-                '<span style="color: green; font-weight: bold;">✓ 启用</span>'
-            )
-        return format_html(
-            '<span style="color: red;">✗ 禁用</span>'
-        )
+        return _ENABLED_BADGES[bool(obj.is_enabled)]
     is_enabled_badge.short_description = '状态'
 
     def schedule_display(self, obj):
@@ -628,7 +657,7 @@ class BackupRecordAdmin(admin.ModelAdmin):
         'status', 'file_path', 'remote_path', 'object_storage_path',
         'remote_protocol', 'remote_host', 'remote_port',
         'remote_user', 'remote_key_path',
-        'file_size_mb', 'start_time', 'end_time',
+        'file_size_mb', 'sha256', 'start_time', 'end_time',
         'error_message', 'created_by', 'created_at'
     ]
     
@@ -649,7 +678,8 @@ class BackupRecordAdmin(admin.ModelAdmin):
                 'remote_user',
                 'remote_key_path',
                 'object_storage_path',
-                'file_size_mb'
+                'file_size_mb',
+                'sha256'
             )
         }),
         ('元数据', {
@@ -660,6 +690,8 @@ class BackupRecordAdmin(admin.ModelAdmin):
     
     list_per_page = 20
     
+    actions = ['purge_records_action']
+    
     # 禁用添加和修改
     def has_add_permission(self, request):
         return False
@@ -667,20 +699,15 @@ class BackupRecordAdmin(admin.ModelAdmin):
     def has_change_permission(self, request, obj=None):
         return False
     
+    @admin.action(description='删除选中记录及备份文件', permissions=['delete'])
+    def purge_records_action(self, request, queryset):
+        """批量删除记录，本地备份文件在提交后异步删除"""
+        deleted = purge_backup_records(queryset)
+        messages.success(request, f'已删除 {deleted} 条备份记录')
+    
     def status_badge(self, obj):
         """显示状态徽章"""
-        status_colors = {
-            'pending': 'gray',
-            'running': 'blue',
-            'success': 'green',
-            'failed': 'red',
-        }
-        color = status_colors.get(obj.status, 'gray')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.get_status_display()
-        )
+        return _status_badge(_RECORD_STATUS_BADGES, obj)
     status_badge.short_description = '状态'
     
     def duration(self, obj):
@@ -736,158 +763,12 @@ class BackupRecordAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
-    def _infer_backup_filenames(self, record):
-        names = []
-        for path_value in [record.file_path, record.remote_path, record.object_storage_path]:
-            if not path_value:
-                continue
-            if path_value.startswith('oss://'):
-                stripped = path_value[len('oss://'):]
-                _, _, key = stripped.partition('/')
-                if key:
-                    name = Path(key).name
-                    if name not in ('', '.', '..'):
-                        names.append(name)
-                        continue
-            name = Path(path_value).name
-            if name not in ('', '.', '..'):
-                names.append(name)
-
-        unique = []
-        for name in names:
-            if name not in unique:
-                unique.append(name)
-
-        if unique:
-            return unique
-
-        timestamp = None
-        if record.start_time:
-            timestamp = record.start_time.strftime('%Y%m%d_%H%M%S')
-        elif record.created_at:
-            timestamp = record.created_at.strftime('%Y%m%d_%H%M%S')
-
-        db_suffix = record.database_name or 'all'
-        alias = record.instance.alias if record.instance else 'backup'
-        candidates = []
-        if timestamp:
-            base = f"{alias}_{db_suffix}_{timestamp}.sql"
-            if record.strategy and not record.strategy.compress:
-                candidates.append(base)
-                candidates.append(base + '.gz')
-            else:
-                candidates.append(base + '.gz')
-                candidates.append(base)
-        candidates.append(f"backup_{record.id}.sql.gz")
-        candidates.append(f"backup_{record.id}.sql")
-
-        unique = []
-        for name in candidates:
-            if name not in unique:
-                unique.append(name)
-        return unique
-
     def _prepare_download_path(self, record):
         errors = []
-
-        filenames = self._infer_backup_filenames(record)
-
-        if record.file_path:
-            file_path = Path(record.file_path)
-            if file_path.exists() and file_path.is_file():
-                return file_path
-            if file_path.exists() and file_path.is_dir():
-                if file_path.name in ('', '.', '..'):
-                    errors.append(f"本地文件路径无效: {file_path}")
-                else:
-                    for name in filenames:
-                        candidate = file_path / name
-                        if candidate.exists() and candidate.is_file():
-                            return candidate
-                    errors.append(f"本地路径是目录: {file_path}")
-            else:
-                errors.append(f"本地文件不存在: {file_path}")
-        else:
-            errors.append("本地文件路径为空")
-
-        backup_root = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
-        temp_dir = backup_root / 'tmp'
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_path = None
-        if filenames:
-            temp_path = temp_dir / filenames[0]
-
-        if record.remote_path:
-            try:
-                remote_candidates = []
-                remote_path = record.remote_path
-                if Path(remote_path).suffix:
-                    remote_candidates.append(remote_path)
-                else:
-                    for name in filenames:
-                        remote_candidates.append(str(Path(remote_path) / name))
-
-                for remote_candidate in remote_candidates:
-                    temp_path = temp_dir / Path(remote_candidate).name
-                    if record.remote_protocol:
-                        client = RemoteStorageClient(
-                            protocol=record.remote_protocol,
-                            host=record.remote_host,
-                            port=record.remote_port,
-                            user=record.remote_user,
-                            password=record.get_decrypted_remote_password(),
-                            key_path=record.remote_key_path
-                        )
-                        client.download(remote_candidate, temp_path)
-                    else:
-                        executor = RemoteExecutor(record.instance)
-                        executor.download(remote_candidate, temp_path)
-                    if temp_path.exists() and temp_path.is_file():
-                        return temp_path
-                errors.append(f"远程下载后文件仍不存在: {temp_path}")
-            except Exception as exc:
-                errors.append(f"远程下载失败: {exc}")
-                logger.warning(f"远程备份下载失败: {exc}")
-        else:
-            errors.append("远程路径为空")
-
-        if record.object_storage_path:
-            oss_config = None
-            if record.strategy and (
-                record.strategy.oss_endpoint
-                or record.strategy.oss_access_key_id
-                or record.strategy.oss_bucket
-            ):
-                oss_config = {
-                    'endpoint': record.strategy.oss_endpoint,
-                    'access_key_id': record.strategy.oss_access_key_id,
-                    'access_key_secret': record.strategy.get_decrypted_oss_access_key_secret(),
-                    'bucket': record.strategy.oss_bucket,
-                    'prefix': record.strategy.oss_prefix
-                }
-            uploader = ObjectStorageUploader(config=oss_config)
-            try:
-                object_path = record.object_storage_path
-                object_candidates = []
-                if object_path.endswith('/'):
-                    for name in filenames:
-                        object_candidates.append(object_path.rstrip('/') + '/' + name)
-                else:
-                    object_candidates.append(object_path)
-
-                for object_candidate in object_candidates:
-                    temp_path = temp_dir / Path(object_candidate).name
-                    uploader.download(object_candidate, temp_path)
-                    if temp_path.exists() and temp_path.is_file():
-                        return temp_path
-                errors.append(f"云存储下载后文件仍不存在: {temp_path}")
-            except Exception as exc:
-                errors.append(f"云存储下载失败: {exc}")
-                logger.warning(f"OSS 备份下载失败: {exc}")
-        else:
-            errors.append("云存储路径为空")
-
-        raise RuntimeError("；".join(errors))
+        download_path = prepare_backup_download_path(record, errors)
+        if download_path is None:
+            raise RuntimeError("；".join(errors))
+        return download_path
 
     def download_view(self, request, record_id):
         record = get_object_or_404(BackupRecord, pk=record_id)
@@ -905,11 +786,18 @@ class BackupRecordAdmin(admin.ModelAdmin):
                 messages.error(request, '备份文件不存在或无法下载')
                 return HttpResponseRedirect(redirect_url)
 
-            return FileResponse(
-                open(download_path, 'rb'),
+            # 配置了 X-Accel-Redirect/X-Sendfile 时由 Web 服务器发送文件。
+            response = build_sendfile_response(download_path)
+            if response is not None:
+                return response
+            response = FileResponse(
+                open(download_path, 'rb', buffering=0),
                 as_attachment=True,
                 filename=download_path.name
             )
+            # 按 1MB 分块读取，减少大文件下载的 read 调用次数。
+            response.block_size = 1024 * 1024
+            return response
         except Exception as exc:
             logger.exception(f"备份下载失败: {exc}")
             messages.error(request, f'下载失败: {exc}')
@@ -950,8 +838,7 @@ class BackupRecordAdmin(admin.ModelAdmin):
                     not record.file_path
                     or Path(record.file_path).resolve() != restore_path.resolve()
                 ):
-                    if restore_path.exists():
-                        restore_path.unlink()
+                    restore_path.unlink(missing_ok=True)
             except Exception as exc:
                 logger.warning(f"清理临时恢复文件失败: {exc}")
 
@@ -1204,19 +1091,7 @@ class BackupOneOffTaskAdmin(admin.ModelAdmin):
     )
 
     def status_badge(self, obj):
-        color_map = {
-            'pending': 'gray',
-            'running': 'blue',
-            'success': 'green',
-            'failed': 'red',
-            'canceled': 'orange'
-        }
-        color = color_map.get(obj.status, 'gray')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.get_status_display()
-        )
+        return _status_badge(_ONEOFF_STATUS_BADGES, obj)
     status_badge.short_description = '状态'
 
     def save_model(self, request, obj, form, change):
@@ -1386,19 +1261,13 @@ class BackupRestoreBoardAdmin(admin.ModelAdmin):
         backup_file = form.cleaned_data['backup_file']
         target_db = form.cleaned_data.get('target_database') or None
 
-        backup_root = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
-        temp_dir = backup_root / 'uploads'
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        safe_name = Path(backup_file.name).name
-        temp_path = temp_dir / f"restore_{uuid4().hex}_{safe_name}"
+        # 上传文件直接流式送入 mysql，不再另存一份到上传目录。
+        suffix = Path(backup_file.name).suffix
+        compression = suffix if suffix in ('.gz', '.zst') else None
 
         try:
-            with open(temp_path, 'wb') as f_out:
-                for chunk in backup_file.chunks():
-                    f_out.write(chunk)
-
             executor = RestoreExecutor(instance)
-            result = executor.execute_restore(str(temp_path), target_db)
+            result = executor.execute_restore_stream(backup_file, target_db, compression)
             if result.get('success'):
                 messages.success(request, '恢复完成')
             else:
@@ -1406,12 +1275,6 @@ class BackupRestoreBoardAdmin(admin.ModelAdmin):
         except Exception as exc:
             logger.exception(f"上传恢复失败: {exc}")
             messages.error(request, f"恢复失败: {exc}")
-        finally:
-            try:
-                if temp_path.exists():
-                    temp_path.unlink()
-            except Exception as exc:
-                logger.warning(f"清理上传文件失败: {exc}")
 
         return HttpResponseRedirect(reverse('admin:backups_backuprestoreboard_changelist'))
 
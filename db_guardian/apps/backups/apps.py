@@ -1,7 +1,21 @@
+import logging
+from pathlib import Path
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class BackupsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.backups'
     verbose_name = '备份管理'
+
+    def ready(self):
+        # 启动时创建远程/OSS 下载临时目录，请求路径上不再逐次 mkdir。
+        temp_dir = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups')) / 'tmp'
+        try:
+            temp_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as exc:
+            logger.warning(f"创建备份临时目录失败 {temp_dir}: {exc}")
@@ -0,0 +1,22 @@
+"""
+备份管理的过滤器
+
+显式声明 FilterSet，过滤器在导入时构建一次，避免 filterset_fields
+每次请求都重新生成 FilterSet 类并内省模型字段。
+"""
+import django_filters
+
+from apps.backups.models import BackupRecord
+
+
+class BackupRecordFilter(django_filters.FilterSet):
+    """备份记录过滤器"""
+
+    class Meta:
+        model = BackupRecord
+        fields = {
+            'instance': ['exact'],
+            'status': ['exact', 'in'],
+            'backup_type': ['exact'],
+            'created_at': ['gte', 'lte'],
+        }
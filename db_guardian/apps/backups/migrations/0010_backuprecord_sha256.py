@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backups', '0009_backuprestoreboard_backuptaskboard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='backuprecord',
+            name='sha256',
+            field=models.CharField(blank=True, default='', help_text='备份文件的 SHA-256 校验值，用于完整性验证', max_length=64, verbose_name='SHA-256'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-16 18:05
+
+import apps.backups.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backups', '0010_backuprecord_sha256'),
+    ]
+
+    operations = [
+        # 已有策略此前一直以 gzip 压缩，按实际使用的算法回填，避免静默切换输出格式。
+        migrations.AddField(
+            model_name='backupstrategy',
+            name='compression_algo',
+            field=models.CharField(choices=[('zstd', 'zstd'), ('gzip', 'gzip')], default='gzip', help_text='逻辑备份的压缩算法，未安装 zstandard 时回退为 gzip', max_length=10, verbose_name='压缩算法'),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='backupstrategy',
+            name='compression_algo',
+            field=models.CharField(choices=[('zstd', 'zstd'), ('gzip', 'gzip')], default=apps.backups.models.default_compression_algo, help_text='逻辑备份的压缩算法，未安装 zstandard 时回退为 gzip', max_length=10, verbose_name='压缩算法'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backups', '0011_backupstrategy_compression_algo'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='backuprecord',
+            index=models.Index(fields=['instance', 'status', 'backup_type', '-created_at'], name='idx_record_inst_status_type'),
+        ),
+    ]
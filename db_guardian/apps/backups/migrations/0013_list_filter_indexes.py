@@ -0,0 +1,69 @@
+# Generated by Django 4.2.30 on 2026-10-16 18:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('instances', '0003_add_remote_backup_root'),
+        ('backups', '0012_backuprecord_base_lookup_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='backuprecord',
+            name='idx_record_instance_status',
+        ),
+        migrations.RemoveIndex(
+            model_name='backuprecord',
+            name='idx_record_status',
+        ),
+        migrations.RemoveIndex(
+            model_name='backupstrategy',
+            name='idx_strategy_instance',
+        ),
+        migrations.RemoveIndex(
+            model_name='backupstrategy',
+            name='idx_strategy_enabled',
+        ),
+        migrations.AddIndex(
+            model_name='backuprecord',
+            index=models.Index(fields=['instance', '-created_at'], name='idx_record_instance_created'),
+        ),
+        migrations.AddIndex(
+            model_name='backuprecord',
+            index=models.Index(fields=['status', '-created_at'], name='idx_record_status_created'),
+        ),
+        migrations.AddIndex(
+            model_name='backuprecord',
+            index=models.Index(fields=['backup_type', '-created_at'], name='idx_record_type_created'),
+        ),
+        migrations.AddIndex(
+            model_name='backuprecord',
+            index=models.Index(fields=['-created_at', '-id'], name='idx_record_created_id'),
+        ),
+        migrations.AddIndex(
+            model_name='backupstrategy',
+            index=models.Index(fields=['instance', '-created_at'], name='idx_strategy_inst_created'),
+        ),
+        migrations.AddIndex(
+            model_name='backupstrategy',
+            index=models.Index(fields=['is_enabled', '-created_at'], name='idx_strategy_enabled_created'),
+        ),
+        migrations.AddIndex(
+            model_name='backupstrategy',
+            index=models.Index(fields=['backup_type', '-created_at'], name='idx_strategy_type'),
+        ),
+        migrations.AlterField(
+            model_name='backuprecord',
+            name='instance',
+            field=models.ForeignKey(db_index=False, help_text='备份的 MySQL 实例', on_delete=django.db.models.deletion.CASCADE, related_name='backup_records', to='instances.mysqlinstance', verbose_name='MySQL 实例'),
+        ),
+        migrations.AlterField(
+            model_name='backupstrategy',
+            name='instance',
+            field=models.ForeignKey(db_index=False, help_text='要备份的 MySQL 实例', on_delete=django.db.models.deletion.CASCADE, related_name='backup_strategies', to='instances.mysqlinstance', verbose_name='MySQL 实例'),
+        ),
+    ]
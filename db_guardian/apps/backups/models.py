@@ -12,6 +12,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 加密存储的凭据字段，save() 时仅在这些列变更时重新加密。
+SECRET_FIELDS = frozenset({'remote_password', 'oss_access_key_secret'})
+
+
+def default_compression_algo():
+    """新建策略的默认压缩算法，取 BACKUP_COMPRESSION_ALGO 配置。"""
+    algo = (getattr(settings, 'BACKUP_COMPRESSION_ALGO', 'zstd') or 'zstd').lower()
+    return algo if algo in ('zstd', 'gzip') else 'zstd'
+
 
 class BackupStrategy(models.Model):
     """
@@ -39,6 +48,11 @@ class BackupStrategy(models.Model):
         ('ftp', _('FTP')),
         ('http', _('HTTP')),
     ]
+
+    COMPRESSION_ALGO_CHOICES = [
+        ('zstd', _('zstd')),
+        ('gzip', _('gzip')),
+    ]
     
     name = models.CharField(
         _('策略名称'),
@@ -50,6 +64,8 @@ class BackupStrategy(models.Model):
         'instances.MySQLInstance',
         on_delete=models.CASCADE,
         related_name='backup_strategies',
+        # 由 idx_strategy_inst_created 的前缀列覆盖，不再单独建外键索引。
+        db_index=False,
         verbose_name=_('MySQL 实例'),
         help_text=_('要备份的 MySQL 实例')
     )
@@ -209,6 +225,14 @@ class BackupStrategy(models.Model):
         default=True,
         help_text=_('是否压缩备份文件')
     )
+
+    compression_algo = models.CharField(
+        _('压缩算法'),
+        max_length=10,
+        choices=COMPRESSION_ALGO_CHOICES,
+        default=default_compression_algo,
+        help_text=_('逻辑备份的压缩算法，未安装 zstandard 时回退为 gzip')
+    )
     
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -229,7 +253,11 @@ class BackupStrategy(models.Model):
     )
 
     def save(self, *args, **kwargs):
-        # 仅在字段变更时加密，避免重复加密。
+        # 仅在字段变更时加密，避免重复加密；未写入凭据列时无需比对旧值。
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not SECRET_FIELDS.intersection(update_fields):
+            super().save(*args, **kwargs)
+            return
         if self.pk:
             old = BackupStrategy.objects.filter(pk=self.pk).only(
                 'remote_password', 'oss_access_key_secret'
@@ -271,9 +299,12 @@ class BackupStrategy(models.Model):
         verbose_name = _('备份策略')
         verbose_name_plural = _('备份策略')
         ordering = ['-created_at']
+        # 列表按 instance/is_enabled/backup_type 过滤并按创建时间倒序分页，
+        # 复合索引让排序直接走索引范围扫描。
         indexes = [
-            models.Index(fields=['instance'], name='idx_strategy_instance'),
-            models.Index(fields=['is_enabled'], name='idx_strategy_enabled'),
+            models.Index(fields=['instance', '-created_at'], name='idx_strategy_inst_created'),
+            models.Index(fields=['is_enabled', '-created_at'], name='idx_strategy_enabled_created'),
+            models.Index(fields=['backup_type', '-created_at'], name='idx_strategy_type'),
         ]
     
     def __str__(self):
@@ -359,6 +390,8 @@ class BackupRecord(models.Model):
         'instances.MySQLInstance',
         on_delete=models.CASCADE,
         related_name='backup_records',
+        # 由以 instance 开头的复合索引覆盖，不再单独建外键索引。
+        db_index=False,
         verbose_name=_('MySQL 实例'),
         help_text=_('备份的 MySQL 实例')
     )
@@ -476,6 +509,14 @@ class BackupRecord(models.Model):
         default=0,
         help_text=_('备份文件的大小（MB）')
     )
+
+    sha256 = models.CharField(
+        _('SHA-256'),
+        max_length=64,
+        blank=True,
+        default='',
+        help_text=_('备份文件的 SHA-256 校验值，用于完整性验证')
+    )
     
     start_time = models.DateTimeField(
         _('开始时间'),
@@ -518,9 +559,19 @@ class BackupRecord(models.Model):
         verbose_name_plural = _('备份记录')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['instance', 'status'], name='idx_record_instance_status'),
             models.Index(fields=['instance', '-start_time'], name='idx_record_instance_time'),
-            models.Index(fields=['status'], name='idx_record_status'),
+            # 列表过滤列 + 默认排序列的复合索引，分页无需在堆上排序。
+            models.Index(fields=['instance', '-created_at'], name='idx_record_instance_created'),
+            models.Index(fields=['status', '-created_at'], name='idx_record_status_created'),
+            models.Index(fields=['backup_type', '-created_at'], name='idx_record_type_created'),
+            # 无过滤条件的列表按 (created_at, id) 倒序分页。
+            models.Index(fields=['-created_at', '-id'], name='idx_record_created_id'),
+            # 增量备份查找最近基准备份：按实例/状态/类型过滤并按创建时间倒序；
+            # 同时覆盖 (instance, status) 前缀查询。
+            models.Index(
+                fields=['instance', 'status', 'backup_type', '-created_at'],
+                name='idx_record_inst_status_type'
+            ),
         ]
     
     def __str__(self):
@@ -761,7 +812,11 @@ class BackupOneOffTask(models.Model):
     )
 
     def save(self, *args, **kwargs):
-        # 仅在字段变更时加密，避免重复加密。
+        # 仅在字段变更时加密，避免重复加密；未写入凭据列时无需比对旧值。
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not SECRET_FIELDS.intersection(update_fields):
+            super().save(*args, **kwargs)
+            return
         if self.pk:
             old = BackupOneOffTask.objects.filter(pk=self.pk).only(
                 'remote_password', 'oss_access_key_secret'
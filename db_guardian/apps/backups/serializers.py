@@ -5,6 +5,8 @@
 """
 from rest_framework import serializers
 from apps.backups.models import BackupStrategy, BackupRecord, BackupOneOffTask
+from apps.backups.services import StrategyManager
+from apps.instances.models import MySQLInstance
 from apps.instances.serializers import MySQLInstanceSerializer
 from apps.authentication.serializers import UserSerializer
 
@@ -26,7 +28,7 @@ class BackupStrategySerializer(serializers.ModelSerializer):
             'id', 'name', 'instance', 'databases', 'cron_expression',
             'backup_type', 'backup_type_display', 'retention_days',
             'is_enabled', 'storage_mode', 'storage_path', 'compress',
-            'store_local', 'store_remote', 'store_oss',
+            'compression_algo', 'store_local', 'store_remote', 'store_oss',
             'remote_storage_path', 'remote_protocol', 'remote_host',
             'remote_port', 'remote_user', 'remote_key_path',
             'oss_endpoint', 'oss_access_key_id', 'oss_bucket', 'oss_prefix',
@@ -52,7 +54,7 @@ class BackupStrategyCreateSerializer(serializers.ModelSerializer):
             'name', 'instance_id', 'databases', 'cron_expression',
             'backup_type', 'retention_days', 'is_enabled',
             'storage_mode', 'storage_path', 'compress',
-            'store_local', 'store_remote', 'store_oss',
+            'compression_algo', 'store_local', 'store_remote', 'store_oss',
             'remote_storage_path', 'remote_protocol', 'remote_host',
             'remote_port', 'remote_user', 'remote_password', 'remote_key_path',
             'oss_endpoint', 'oss_access_key_id', 'oss_access_key_secret',
@@ -99,7 +101,6 @@ class BackupStrategyCreateSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: 实例不存在时抛出
         """
-        from apps.instances.models import MySQLInstance
         
         if not MySQLInstance.objects.filter(id=value).exists():
             raise serializers.ValidationError("指定的 MySQL 实例不存在")
@@ -124,7 +125,6 @@ class BackupStrategyCreateSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         """验证策略与实例的备份配置"""
-        from apps.instances.models import MySQLInstance
 
         instance_id = attrs.get('instance_id')
         backup_type = attrs.get('backup_type')
@@ -213,7 +213,6 @@ class BackupStrategyCreateSerializer(serializers.ModelSerializer):
         Returns:
             BackupStrategy: 创建的策略实例
         """
-        from apps.instances.models import MySQLInstance
         
         instance_id = validated_data.pop('instance_id')
         instance = MySQLInstance.objects.get(id=instance_id)
@@ -226,7 +225,6 @@ class BackupStrategyCreateSerializer(serializers.ModelSerializer):
         
         # 如果策略启用，同步到 Celery Beat
         if strategy.is_enabled:
-            from apps.backups.services import StrategyManager
             StrategyManager.sync_to_celery_beat()
         
         return strategy
@@ -245,7 +243,6 @@ class BackupStrategyCreateSerializer(serializers.ModelSerializer):
         # 如果提供了 instance_id，更新实例关联
         instance_id = validated_data.pop('instance_id', None)
         if instance_id:
-            from apps.instances.models import MySQLInstance
             instance.instance = MySQLInstance.objects.get(id=instance_id)
         
         # 更新其他字段
@@ -255,7 +252,6 @@ class BackupStrategyCreateSerializer(serializers.ModelSerializer):
         instance.save()
         
         # 同步到 Celery Beat
-        from apps.backups.services import StrategyManager
         StrategyManager.sync_to_celery_beat()
         
         return instance
@@ -283,14 +279,14 @@ class BackupRecordSerializer(serializers.ModelSerializer):
             'id', 'instance', 'strategy', 'database_name', 'backup_type',
             'backup_type_display', 'status', 'status_display', 'file_path',
             'remote_path', 'object_storage_path',
-            'file_size_mb', 'start_time', 'end_time', 'duration_seconds',
+            'file_size_mb', 'sha256', 'start_time', 'end_time', 'duration_seconds',
             'error_message', 'created_by', 'created_at', 'download_url',
             'base_backup_id'
         ]
         read_only_fields = [
             'id', 'instance', 'strategy', 'database_name', 'backup_type',
             'backup_type_display', 'status', 'status_display', 'file_path',
-            'remote_path', 'object_storage_path', 'file_size_mb', 'start_time',
+            'remote_path', 'object_storage_path', 'file_size_mb', 'sha256', 'start_time',
             'end_time', 'duration_seconds', 'error_message', 'created_by',
             'created_at', 'download_url', 'base_backup_id'
         ]
@@ -475,6 +471,23 @@ class RestoreUploadSerializer(serializers.Serializer):
         return value
 
 
+class VerifyBulkSerializer(serializers.Serializer):
+    """
+    批量验证请求序列化器
+
+    ID 必须为正整数，单次最多 VERIFY_BULK_MAX_IDS 条。
+    """
+
+    VERIFY_BULK_MAX_IDS = 500
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=VERIFY_BULK_MAX_IDS,
+        help_text='要验证的备份记录 ID 列表'
+    )
+
+
 class BackupRecordListSerializer(serializers.ModelSerializer):
     """
     备份记录列表序列化器
@@ -558,8 +571,6 @@ class BackupOneOffTaskCreateSerializer(serializers.ModelSerializer):
         return value
 
     def validate(self, attrs):
-        from apps.instances.models import MySQLInstance
-
         instance_id = attrs.get('instance_id')
         backup_type = attrs.get('backup_type')
         storage_mode = attrs.get('storage_mode')
@@ -639,8 +650,6 @@ class BackupOneOffTaskCreateSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        from apps.instances.models import MySQLInstance
-
         instance_id = validated_data.pop('instance_id')
         instance = MySQLInstance.objects.get(id=instance_id)
         validated_data['instance'] = instance
@@ -650,7 +659,6 @@ class BackupOneOffTaskCreateSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         instance_id = validated_data.pop('instance_id', None)
         if instance_id:
-            from apps.instances.models import MySQLInstance
             instance.instance = MySQLInstance.objects.get(id=instance_id)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -5,19 +5,33 @@
 """
 import os
 import shlex
+import stat
 import subprocess
+import tempfile
+import threading
 import gzip
 import shutil
 import ftplib
 import requests
 from pathlib import Path
-from datetime import datetime
+import time
+from collections import OrderedDict
+from urllib.parse import quote
 from django.conf import settings
+from django.http import HttpResponse
+from django.utils.http import content_disposition_header
+from django.db import transaction
 from django.utils import timezone
-from django_celery_beat.models import PeriodicTask, CrontabSchedule
+from django_celery_beat.models import PeriodicTask, PeriodicTasks, CrontabSchedule
+from apps.instances.models import PasswordEncryptor
+from apps.backups.models import BackupStrategy
 import logging
 import json
+import hashlib
 import paramiko
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +40,190 @@ try:
 except ImportError:  # pragma: no cover - 可选依赖
     oss2 = None
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 可选依赖
+    zstandard = None
+
+
+# 已压缩文件的魔数与对应后缀。
+COMPRESSED_MAGICS = (
+    (b'\x1f\x8b', '.gz'),
+    (b'\x28\xb5\x2f\xfd', '.zst'),
+)
+
+
+def compute_file_sha256(file_path) -> str:
+    """
+    流式计算文件 SHA-256
+
+    hashlib.file_digest 以预分配缓冲区 readinto 读取并直接交给 OpenSSL，
+    循环不在 Python 层分配分块对象；CPU 支持时自动使用 SHA 指令。
+    """
+    with open(file_path, 'rb', buffering=0) as f_in:
+        return hashlib.file_digest(f_in, 'sha256').hexdigest()
+
+
+class _ChecksumWriter:
+    """写入时同步计算 SHA-256 与字节数的文件包装，供压缩流单次遍历使用。"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self._fileobj.write(data)
+
+    def flush(self) -> None:
+        self._fileobj.flush()
+
+
+def _detect_compressed_suffix(head: bytes):
+    """根据数据头部魔数判断是否已压缩，已压缩时返回对应后缀，否则返回 None。"""
+    for magic, suffix in COMPRESSED_MAGICS:
+        if head.startswith(magic):
+            return suffix
+    return None
+
+
+def resolve_compression_algo(algo=None) -> str:
+    """确定实际使用的压缩算法，未安装 zstandard 时回退为 gzip。"""
+    algo = (algo or getattr(settings, 'BACKUP_COMPRESSION_ALGO', 'zstd') or 'gzip').lower()
+    if algo == 'zstd' and zstandard is None:
+        logger.warning("未安装 zstandard，备份压缩回退为 gzip")
+        return 'gzip'
+    return algo if algo in ('zstd', 'gzip') else 'gzip'
+
+
+def _open_compressor(algo, fileobj, inner_name):
+    """按算法创建写入 fileobj 的压缩流，zstd 按 BACKUP_COMPRESSION_THREADS 多线程压缩。"""
+    if algo == 'zstd':
+        return zstandard.ZstdCompressor(
+            level=getattr(settings, 'BACKUP_ZSTD_LEVEL', 3),
+            threads=getattr(settings, 'BACKUP_COMPRESSION_THREADS', -1)
+        ).stream_writer(fileobj, closefd=False)
+    return gzip.GzipFile(
+        filename=inner_name,
+        mode='wb',
+        compresslevel=getattr(settings, 'BACKUP_GZIP_LEVEL', 1),
+        fileobj=fileobj,
+        mtime=0
+    )
+
+
+def _stream_to_target(f_in, open_target, base_name, compress, compression_algo='gzip',
+                      chunk_size: int = 1024 * 1024):
+    """
+    单次遍历把输入流写入 open_target 打开的目标
+
+    压缩与 SHA-256 在同一遍中完成：输入 → gzip/zstd → 校验和 → 目标，
+    不再先落地未压缩文件再回读压缩/计算哈希。输入本身已是 gzip/zstd 时原样写入。
+
+    Args:
+        f_in: 可读的二进制流（如 mysqldump 的 stdout）
+        open_target: 以最终文件名为参数、返回可写上下文的函数（本地文件/SFTP/OSS）
+        base_name: 未压缩时的文件名
+        compress: 是否压缩
+        compression_algo: 压缩算法（zstd/gzip）
+
+    Returns:
+        tuple: (最终文件名, _ChecksumWriter)
+    """
+    chunk = f_in.read(chunk_size)
+    existing_suffix = _detect_compressed_suffix(chunk) if compress else None
+    if compress:
+        algo_suffix = '.zst' if compression_algo == 'zstd' else '.gz'
+        target_name = base_name + (existing_suffix or algo_suffix)
+    else:
+        target_name = base_name
+
+    with open_target(target_name) as raw_out:
+        checksum = _ChecksumWriter(raw_out)
+        if compress and not existing_suffix:
+            f_out = _open_compressor(compression_algo, checksum, base_name)
+        else:
+            # 已压缩或无需压缩时直接写入。
+            f_out = checksum
+        while chunk:
+            f_out.write(chunk)
+            chunk = f_in.read(chunk_size)
+        if f_out is not checksum:
+            f_out.close()
+    return target_name, checksum
+
+
+def _stream_to_file(f_in, file_path, compress, compression_algo='gzip', chunk_size: int = 1024 * 1024):
+    """
+    单次遍历把输入流写入本地备份文件，同时计算 SHA-256
+
+    Args:
+        f_in: 可读的二进制流（如 mysqldump 的 stdout）
+        file_path: Path 对象，未压缩时的目标文件路径
+        compress: 是否压缩
+        compression_algo: 压缩算法（zstd/gzip）
+
+    Returns:
+        tuple: (最终文件路径, SHA-256)
+    """
+    opened = []
+
+    def open_target(name):
+        opened.append(file_path.with_name(name))
+        return open(opened[-1], 'wb')
+
+    try:
+        _, checksum = _stream_to_target(
+            f_in, open_target, file_path.name, compress, compression_algo, chunk_size
+        )
+    except BaseException:
+        # 写入中断时不保留不完整的文件。
+        for target_path in opened:
+            target_path.unlink(missing_ok=True)
+        raise
+
+    return opened[0], checksum.sha256.hexdigest()
+
+
+def _fadvise(fileobj, advice: str) -> None:
+    """向内核提示文件访问模式，不支持的平台直接跳过。"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fileobj.fileno(), 0, 0, getattr(os, advice))
+    except (OSError, AttributeError):
+        pass
+
+
+@lru_cache(maxsize=8)
+def _binary_supports_ssl_mode(binary: str) -> bool:
+    """检测客户端命令是否支持 --ssl-mode 选项（按命令路径缓存探测结果）。"""
+    try:
+        # 通过帮助输出检测是否支持参数。
+        result = subprocess.run(
+            [binary, '--help'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        output = f"{result.stdout}\n{result.stderr}"
+        return 'ssl-mode' in output
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=128)
+def _decrypt_instance_password(instance_id, updated_at, encrypted: str) -> str:
+    """按 (实例ID, 更新时间) 缓存解密后的实例密码，密码轮换后 updated_at 变化即失效。"""
+    return PasswordEncryptor.decrypt(encrypted)
+
+
+def _get_instance_password(instance) -> str:
+    """获取实例明文密码，同一 worker 内每个实例只解密一次。"""
+    return _decrypt_instance_password(instance.id, instance.updated_at, instance.password)
+
 
 class RemoteExecutor:
     """远程命令执行与文件传输（支持本地直连）"""
@@ -54,10 +252,75 @@ class RemoteExecutor:
             self.user = (user or '').strip()
             self.password = password
             self.key_path = (key_path or '').strip()
+        self._client = None
+        self._client_lock = threading.Lock()
+        # 会话模式下进行中的操作数、最近一次操作结束时间，以及操作结束后是否需要关闭连接。
+        self._active = 0
+        self._last_released = time.monotonic()
+        self._close_pending = False
+
+    def __enter__(self):
+        """进入会话模式：上下文内的 run/upload/download 复用同一个 SSH 连接。"""
+        if self._is_remote():
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """关闭会话模式下保持的 SSH 连接；仍有进行中的操作时推迟到最后一个操作结束再关闭。"""
+        with self._client_lock:
+            if self._active:
+                self._close_pending = True
+                return
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def idle_seconds(self) -> float:
+        """会话连接自最近一次操作结束以来的空闲秒数，有进行中的操作时为 0。"""
+        with self._client_lock:
+            if self._active:
+                return 0.0
+            return time.monotonic() - self._last_released
 
     def _is_remote(self) -> bool:
         return bool(self.host and self.user)
 
+    @contextmanager
+    def _session(self):
+        """获取 SSH 连接：会话模式下复用（断开时重连），否则临时建立并在用完后关闭。"""
+        with self._client_lock:
+            client = self._client
+            if client is not None:
+                transport = client.get_transport()
+                if transport is None or not transport.is_active():
+                    client.close()
+                    client = self._client = self._connect()
+                self._active += 1
+        if client is None:
+            client = self._connect()
+            try:
+                yield client
+            finally:
+                client.close()
+            return
+        try:
+            yield client
+        finally:
+            stale = None
+            with self._client_lock:
+                self._active -= 1
+                self._last_released = time.monotonic()
+                if not self._active and self._close_pending:
+                    stale, self._client = self._client, None
+                    self._close_pending = False
+            if stale is not None:
+                stale.close()
+
     def _connect(self):
         # 建立 SSH 连接，优先使用密钥认证。
         client = paramiko.SSHClient()
@@ -81,13 +344,10 @@ class RemoteExecutor:
             )
             return result.returncode, result.stdout, result.stderr
 
-        client = self._connect()
-        try:
+        with self._session() as client:
             stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
             exit_status = stdout.channel.recv_exit_status()
             return exit_status, stdout.read().decode(), stderr.read().decode()
-        finally:
-            client.close()
 
     def download(self, remote_path: str, local_path: Path) -> None:
         # 本地执行时把 remote_path 当作本地路径。
@@ -95,13 +355,44 @@ class RemoteExecutor:
             shutil.copy2(remote_path, local_path)
             return
 
-        client = self._connect()
-        try:
+        with self._session() as client:
             sftp = client.open_sftp()
-            sftp.get(remote_path, str(local_path))
-            sftp.close()
-        finally:
-            client.close()
+            try:
+                sftp.get(remote_path, str(local_path))
+            finally:
+                sftp.close()
+
+    def exists(self, remote_path: str) -> bool:
+        """判断远程文件是否存在（SFTP stat），本地执行时检查本地路径。"""
+        if not self._is_remote():
+            return os.path.isfile(remote_path)
+
+        with self._session() as client:
+            sftp = client.open_sftp()
+            try:
+                sftp.stat(remote_path)
+                return True
+            except IOError:
+                return False
+            finally:
+                sftp.close()
+
+    @contextmanager
+    def open_write(self, remote_path: str):
+        """以流式写入方式打开远程文件（SFTP 流水线写入），本地执行时打开本地文件。"""
+        if not self._is_remote():
+            with open(remote_path, 'wb') as f_out:
+                yield f_out
+            return
+
+        with self._session() as client:
+            sftp = client.open_sftp()
+            try:
+                with sftp.open(remote_path, 'wb') as f_out:
+                    f_out.set_pipelined(True)
+                    yield f_out
+            finally:
+                sftp.close()
 
     def upload(self, local_path: Path, remote_path: str) -> None:
         # 本地执行时把 remote_path 当作本地路径。
@@ -109,13 +400,12 @@ class RemoteExecutor:
             shutil.copy2(local_path, remote_path)
             return
 
-        client = self._connect()
-        try:
+        with self._session() as client:
             sftp = client.open_sftp()
-            sftp.put(str(local_path), remote_path)
-            sftp.close()
-        finally:
-            client.close()
+            try:
+                sftp.put(str(local_path), remote_path)
+            finally:
+                sftp.close()
 
 
 class RemoteStorageClient:
@@ -129,6 +419,43 @@ class RemoteStorageClient:
         self.user = user or ''
         self.password = password
         self.key_path = key_path or ''
+        self._pooled = False
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _ssh_executor(self) -> RemoteExecutor:
+        """获取 SSH 执行器：池化客户端复用常驻连接，否则每次操作临时连接。"""
+        if not self._pooled:
+            return RemoteExecutor(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                key_path=self.key_path
+            )
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = RemoteExecutor(
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    password=self.password,
+                    key_path=self.key_path
+                ).__enter__()
+            return self._executor
+
+    def close(self) -> None:
+        """关闭池化客户端持有的 SSH 连接（进行中的传输结束后才真正断开）。"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.close()
+
+    def idle_seconds(self):
+        """常驻 SSH 连接的空闲秒数；尚未建立常驻连接时返回 None。"""
+        with self._executor_lock:
+            executor = self._executor
+        return None if executor is None else executor.idle_seconds()
 
     def _ensure_ready(self):
         if not self.protocol:
@@ -167,13 +494,7 @@ class RemoteStorageClient:
         # 按协议进行轻量连通性检查。
         self._ensure_ready()
         if self.protocol == 'ssh':
-            executor = RemoteExecutor(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                key_path=self.key_path
-            )
+            executor = self._ssh_executor()
             code, _, stderr = executor.run('echo ok', timeout=10)
             return (code == 0, stderr or 'ok')
         if self.protocol == 'ftp':
@@ -199,13 +520,7 @@ class RemoteStorageClient:
         # 按协议执行上传。
         self._ensure_ready()
         if self.protocol == 'ssh':
-            executor = RemoteExecutor(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                key_path=self.key_path
-            )
+            executor = self._ssh_executor()
             remote_dir = str(Path(remote_path).parent).replace('\\', '/')
             if remote_dir:
                 executor.run(f"mkdir -p {shlex.quote(remote_dir)}")
@@ -236,17 +551,37 @@ class RemoteStorageClient:
             return url
         raise RuntimeError(f"不支持的协议: {self.protocol}")
 
+    def exists(self, remote_path: str) -> bool:
+        # 按协议做轻量存在性探测，无法判断时返回 True 交由下载决定。
+        self._ensure_ready()
+        if self.protocol == 'ssh':
+            executor = self._ssh_executor()
+            return executor.exists(remote_path)
+        if self.protocol == 'ftp':
+            ftp = self._ftp_connect()
+            try:
+                ftp.voidcmd('TYPE I')
+                ftp.size(remote_path)
+                return True
+            except ftplib.error_perm:
+                return False
+            finally:
+                try:
+                    ftp.quit()
+                except Exception:
+                    ftp.close()
+        if self.protocol == 'http':
+            url = self._build_http_url(remote_path)
+            auth = (self.user, self.password) if self.user or self.password else None
+            resp = requests.head(url, auth=auth, timeout=10)
+            return resp.status_code < 400 or resp.status_code == 405
+        return True
+
     def download(self, remote_path: str, local_path: Path) -> None:
         # 按协议执行下载。
         self._ensure_ready()
         if self.protocol == 'ssh':
-            executor = RemoteExecutor(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                key_path=self.key_path
-            )
+            executor = self._ssh_executor()
             executor.download(remote_path, local_path)
             return
         if self.protocol == 'ftp':
@@ -277,6 +612,132 @@ class RemoteStorageClient:
         raise RuntimeError(f"不支持的协议: {self.protocol}")
 
 
+# 进程内的远程存储客户端池：相同凭据复用 SSH 连接，最近一次操作结束后空闲超时才关闭。
+_REMOTE_CLIENT_IDLE_SECONDS = 15 * 60
+_remote_client_pool: dict = {}
+_remote_client_pool_lock = threading.Lock()
+
+
+def get_pooled_client(protocol, host, port, user, password, key_path) -> RemoteStorageClient:
+    """
+    按凭据获取池化的 RemoteStorageClient
+
+    密码仅以 SHA256 摘要参与池键；每次获取时顺带回收空闲超过 15 分钟的客户端：
+    获取时间与最近一次操作结束时间都须超时，正在传输的客户端不会被回收。
+    """
+    key = (
+        (protocol or '').lower(), (host or '').strip(), port, user or '',
+        hashlib.sha256((password or '').encode('utf-8')).hexdigest(), key_path or '',
+    )
+    now = time.monotonic()
+    stale = []
+    with _remote_client_pool_lock:
+        for pool_key, (pooled, last_acquired) in list(_remote_client_pool.items()):
+            if pool_key == key or now - last_acquired <= _REMOTE_CLIENT_IDLE_SECONDS:
+                continue
+            idle = pooled.idle_seconds()
+            if idle is None or idle > _REMOTE_CLIENT_IDLE_SECONDS:
+                del _remote_client_pool[pool_key]
+                stale.append(pooled)
+        entry = _remote_client_pool.get(key)
+        if entry is None:
+            client = RemoteStorageClient(protocol, host, port, user, password, key_path)
+            client._pooled = True
+        else:
+            client = entry[0]
+        _remote_client_pool[key] = (client, now)
+    for pooled in stale:
+        pooled.close()
+    return client
+
+
+class _OssMultipartWriter:
+    """把写入的数据攒够一个分片后上传到 OSS 的可写对象。"""
+
+    def __init__(self, bucket, object_key: str, part_size: int):
+        self._bucket = bucket
+        self._object_key = object_key
+        # OSS 除最后一片外每片至少 100KB。
+        self._part_size = max(part_size, 100 * 1024)
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = bucket.init_multipart_upload(object_key).upload_id
+        self.location = ''
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._part_size:
+            self._upload_part(bytes(self._buffer[:self._part_size]))
+            del self._buffer[:self._part_size]
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def _upload_part(self, data: bytes) -> None:
+        part_number = len(self._parts) + 1
+        result = self._bucket.upload_part(self._object_key, self._upload_id, part_number, data)
+        self._parts.append(oss2.models.PartInfo(part_number, result.etag))
+
+    def complete(self) -> None:
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        self._bucket.complete_multipart_upload(self._object_key, self._upload_id, self._parts)
+
+    def abort(self) -> None:
+        try:
+            self._bucket.abort_multipart_upload(self._object_key, self._upload_id)
+        except Exception as exc:
+            logger.warning(f"取消 OSS 分片上传失败: {exc}")
+
+
+class _SftpStreamTarget:
+    """mysqldump 输出经 SFTP 直接写入远程目录的流式目标。"""
+
+    def __init__(self, session: 'RemoteExecutor', remote_dir: str):
+        self.session = session
+        self.remote_dir = remote_dir
+        self.location = ''
+
+    @contextmanager
+    def open(self, name: str):
+        self.location = f"{self.remote_dir}/{name}"
+        self.session.run(f"mkdir -p {shlex.quote(self.remote_dir)}")
+        try:
+            with self.session.open_write(self.location) as f_out:
+                yield f_out
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        if self.location:
+            self.session.run(f"rm -f {shlex.quote(self.location)}")
+
+
+class _OssStreamTarget:
+    """mysqldump 输出以分片上传直接写入 OSS 的流式目标。"""
+
+    def __init__(self, uploader: 'ObjectStorageUploader', instance_alias: str):
+        self.uploader = uploader
+        self.instance_alias = instance_alias
+        self.location = ''
+
+    @contextmanager
+    def open(self, name: str):
+        with self.uploader.open_stream(self.instance_alias, name) as writer:
+            self.location = writer.location
+            yield writer
+
+    def discard(self) -> None:
+        if self.location:
+            try:
+                self.uploader.delete(self.location)
+            except Exception as exc:
+                logger.warning(f"删除 OSS 对象失败 {self.location}: {exc}")
+
+
 class ObjectStorageUploader:
     """对象存储上传（Aliyun OSS）。"""
 
@@ -295,6 +756,20 @@ class ObjectStorageUploader:
             self.access_key_secret = getattr(settings, 'OSS_ACCESS_KEY_SECRET', '')
             self.bucket = getattr(settings, 'OSS_BUCKET', '')
             self.prefix = getattr(settings, 'OSS_PREFIX', '')
+        self._bucket_client = None
+        self._bucket_lock = threading.Lock()
+
+    def _get_bucket(self, bucket_name=None):
+        """获取 Bucket 客户端，默认 Bucket 复用同一个实例及其 HTTP 连接池。"""
+        bucket_name = bucket_name or self.bucket
+        if bucket_name != self.bucket:
+            auth = oss2.Auth(self.access_key_id, self.access_key_secret)
+            return oss2.Bucket(auth, self.endpoint, bucket_name)
+        with self._bucket_lock:
+            if self._bucket_client is None:
+                auth = oss2.Auth(self.access_key_id, self.access_key_secret)
+                self._bucket_client = oss2.Bucket(auth, self.endpoint, self.bucket)
+        return self._bucket_client
 
     def _is_ready(self) -> bool:
         return bool(
@@ -316,39 +791,426 @@ class ObjectStorageUploader:
         if not self._is_ready():
             return None
 
-        prefix = str(self.prefix).strip('/')
-        parts = [p for p in [prefix, instance_alias, filename] if p]
-        object_key = '/'.join(parts)
-
-        auth = oss2.Auth(self.access_key_id, self.access_key_secret)
-        bucket = oss2.Bucket(auth, self.endpoint, self.bucket)
+        object_key = self._object_key(instance_alias, filename)
+        bucket = self._get_bucket()
         result = bucket.put_object_from_file(object_key, str(local_path))
         if result.status not in (200, 201):
             raise RuntimeError(f'OSS 上传失败: status={result.status}')
         return f"oss://{self.bucket}/{object_key}"
 
+    def _object_key(self, instance_alias: str, filename: str) -> str:
+        prefix = str(self.prefix).strip('/')
+        return '/'.join(p for p in [prefix, instance_alias, filename] if p)
+
+    @contextmanager
+    def open_stream(self, instance_alias: str, filename: str):
+        """
+        以分片上传方式流式写入对象，正常退出时合并分片，异常时取消上传
+
+        Yields:
+            _OssMultipartWriter: 可写对象，location 为 oss:// 路径
+        """
+        if not self._is_ready():
+            raise RuntimeError('OSS 未配置或不可用')
+        object_key = self._object_key(instance_alias, filename)
+        writer = _OssMultipartWriter(
+            self._get_bucket(),
+            object_key,
+            getattr(settings, 'BACKUP_STREAM_PART_SIZE_MB', 16) * 1024 * 1024
+        )
+        writer.location = f"oss://{self.bucket}/{object_key}"
+        try:
+            yield writer
+        except BaseException:
+            writer.abort()
+            raise
+        writer.complete()
+
+    def delete(self, object_path: str) -> None:
+        bucket_name, object_key = self._parse_object_path(object_path)
+        self._get_bucket(bucket_name).delete_object(object_key)
+
     def download(self, object_path: str, local_path: Path) -> None:
         if not self._is_ready():
             raise RuntimeError('OSS 未配置或不可用')
         bucket_name, object_key = self._parse_object_path(object_path)
-        auth = oss2.Auth(self.access_key_id, self.access_key_secret)
-        bucket = oss2.Bucket(auth, self.endpoint, bucket_name)
+        bucket = self._get_bucket(bucket_name)
         result = bucket.get_object_to_file(object_key, str(local_path))
         if result.status not in (200, 201, 206):
             raise RuntimeError(f'OSS 下载失败: status={result.status}')
 
+    def download_parallel(self, object_path: str, local_path: Path, parts: int = 8,
+                          chunk_size: int = 1024 * 1024) -> None:
+        """
+        按字节区间并发 GET 下载大对象
+
+        先 HEAD 获取大小，再由线程池分段拉取并 pwrite 到目标文件对应偏移；
+        任一分段失败时删除不完整的目标文件。
+        """
+        if not self._is_ready():
+            raise RuntimeError('OSS 未配置或不可用')
+        bucket_name, object_key = self._parse_object_path(object_path)
+        bucket = self._get_bucket(bucket_name)
+        size = bucket.head_object(object_key).content_length
+        part_size = -(-size // max(parts, 1))
+        if size <= chunk_size or part_size <= chunk_size:
+            # 对象太小，分段收益不抵额外请求。
+            self.download(object_path, local_path)
+            return
+
+        ranges = [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+        fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        def fetch(byte_range):
+            offset, end = byte_range
+            result = bucket.get_object(object_key, byte_range=byte_range)
+            while chunk := result.read(chunk_size):
+                view = memoryview(chunk)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    offset += written
+                    view = view[written:]
+            if offset != end + 1:
+                raise RuntimeError(f'OSS 分段下载不完整: {byte_range[0]}-{end}')
+
+        try:
+            os.ftruncate(fd, size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                list(pool.map(fetch, ranges))
+        except BaseException:
+            os.close(fd)
+            fd = None
+            Path(local_path).unlink(missing_ok=True)
+            raise
+        finally:
+            if fd is not None:
+                os.close(fd)
+
     def test_connection(self) -> tuple[bool, str]:
         if not self._is_ready():
             return False, 'OSS 未配置或不可用'
         try:
-            auth = oss2.Auth(self.access_key_id, self.access_key_secret)
-            bucket = oss2.Bucket(auth, self.endpoint, self.bucket)
-            bucket.get_bucket_info()
+            self._get_bucket().get_bucket_info()
             return True, 'ok'
         except Exception as exc:
             return False, str(exc)
 
 
+# 按配置缓存的对象存储客户端（oss2.Bucket 线程安全，可跨请求复用连接池）。
+_UPLOADER_CACHE_MAX = 32
+_uploader_cache: dict = {}
+_uploader_cache_lock = threading.Lock()
+
+
+def get_object_storage_uploader(config: dict | None = None) -> ObjectStorageUploader:
+    """返回按配置复用的 ObjectStorageUploader，密钥仅以 SHA256 摘要参与缓存键。"""
+    if config:
+        secret = config.get('access_key_secret', '') or ''
+        key = (
+            config.get('endpoint', '') or '',
+            config.get('access_key_id', '') or '',
+            config.get('bucket', '') or '',
+            config.get('prefix', '') or '',
+            hashlib.sha256(secret.encode('utf-8')).hexdigest(),
+        )
+    else:
+        key = ('settings',)
+
+    with _uploader_cache_lock:
+        uploader = _uploader_cache.pop(key, None)
+        if uploader is None:
+            uploader = ObjectStorageUploader(config=config)
+            if len(_uploader_cache) >= _UPLOADER_CACHE_MAX:
+                # 淘汰最早加入的条目。
+                _uploader_cache.pop(next(iter(_uploader_cache)))
+        _uploader_cache[key] = uploader
+        return uploader
+
+
+def infer_backup_filenames(record):
+    """推断备份记录在各存储位置上可能的文件名（按优先级排序）。"""
+    # 汇总所有存储位置的可能文件名，提高命中率；结果只由记录字段决定，按字段缓存。
+    timestamp_source = record.start_time or record.created_at
+    return list(_infer_backup_filenames_cached(
+        record.id,
+        record.file_path,
+        record.remote_path,
+        record.object_storage_path,
+        timestamp_source.strftime('%Y%m%d_%H%M%S') if timestamp_source else None,
+        record.database_name,
+        record.instance.alias if record.instance else 'backup',
+        bool(record.strategy and not record.strategy.compress),
+    ))
+
+
+# 回退文件名模板：按时间戳命名（键为是否优先未压缩文件）及按记录 ID 命名。
+_TIMESTAMP_NAME_TEMPLATES = {
+    True: ('{alias}_{db}_{ts}.sql', '{alias}_{db}_{ts}.sql.zst', '{alias}_{db}_{ts}.sql.gz'),
+    False: ('{alias}_{db}_{ts}.sql.zst', '{alias}_{db}_{ts}.sql.gz', '{alias}_{db}_{ts}.sql'),
+}
+_RECORD_NAME_TEMPLATES = ('backup_{id}.sql.zst', 'backup_{id}.sql.gz', 'backup_{id}.sql')
+
+
+def _path_basename(path_value) -> str:
+    """取路径（含 oss:// 对象键）的文件名，无有效文件名时返回空串。"""
+    if path_value.startswith('oss://'):
+        _, _, key = path_value[len('oss://'):].partition('/')
+        if key:
+            name = Path(key).name
+            if name not in ('', '.', '..'):
+                return name
+    name = Path(path_value).name
+    return name if name not in ('', '.', '..') else ''
+
+
+@lru_cache(maxsize=512)
+def _infer_backup_filenames_cached(
+    record_id, file_path, remote_path, object_storage_path,
+    timestamp, database_name, alias, prefer_plain
+):
+    # dict.fromkeys 保序去重，生成器直接喂入避免中间列表。
+    path_values = (file_path, remote_path, object_storage_path)
+    unique = tuple(dict.fromkeys(
+        name for name in (_path_basename(value) for value in path_values if value) if name
+    ))
+    if unique:
+        return unique
+
+    # 回退为根据记录元数据生成文件名。
+    context = {'alias': alias, 'db': database_name or 'all', 'ts': timestamp, 'id': record_id}
+    templates = _RECORD_NAME_TEMPLATES
+    if timestamp:
+        templates = _TIMESTAMP_NAME_TEMPLATES[prefer_plain] + templates
+    return tuple(dict.fromkeys(template.format_map(context) for template in templates))
+
+
+# 本地备份路径的负缓存：UI 轮询/重试时，近期已确认缺失的路径直接跳过 stat。
+_MISSING_PATH_TTL = 30.0
+_MISSING_PATH_MAX = 4096
+_missing_paths = OrderedDict()
+_missing_paths_lock = threading.Lock()
+
+
+def _local_path_mode(path) -> int:
+    """stat 本地路径并返回 st_mode，不存在（含负缓存命中）时返回 0。"""
+    key = str(path)
+    now = time.monotonic()
+    with _missing_paths_lock:
+        expires_at = _missing_paths.get(key)
+        if expires_at is not None:
+            if expires_at > now:
+                return 0
+            del _missing_paths[key]
+    try:
+        return os.stat(key).st_mode
+    except FileNotFoundError:
+        with _missing_paths_lock:
+            _missing_paths[key] = now + _MISSING_PATH_TTL
+            _missing_paths.move_to_end(key)
+            while len(_missing_paths) > _MISSING_PATH_MAX:
+                _missing_paths.popitem(last=False)
+        return 0
+    except OSError:
+        return 0
+
+
+def _is_regular_file(path) -> bool:
+    """单次 stat 判断路径是否为普通文件（替代 exists() + is_file() 两次 stat）。"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+# 超过该大小（MB）的 OSS 备份使用分段并发下载。
+_OSS_PARALLEL_DOWNLOAD_MIN_MB = 64
+
+
+def _download_to_temp(download, source, temp_path) -> None:
+    """下载到临时目录；目录在启动后被删除时重建一次再重试。"""
+    try:
+        download(source, temp_path)
+    except FileNotFoundError:
+        if temp_path.parent.is_dir():
+            raise
+        temp_path.parent.mkdir(parents=True, exist_ok=True)
+        download(source, temp_path)
+
+
+def build_sendfile_response(file_path):
+    """
+    构造交由 Web 服务器以 sendfile 发送文件的响应
+
+    配置了 BACKUP_ACCEL_REDIRECT_PREFIX 时使用 nginx 的 X-Accel-Redirect，
+    开启 BACKUP_XSENDFILE 时使用 Apache mod_xsendfile 的 X-Sendfile。
+    仅对备份根目录下的文件生效，否则返回 None，由调用方回退为 FileResponse。
+    """
+    prefix = getattr(settings, 'BACKUP_ACCEL_REDIRECT_PREFIX', '')
+    use_xsendfile = getattr(settings, 'BACKUP_XSENDFILE', False)
+    if not prefix and not use_xsendfile:
+        return None
+    backup_root = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
+    try:
+        relative = Path(file_path).relative_to(backup_root)
+    except ValueError:
+        return None
+    if '..' in relative.parts:
+        return None
+
+    response = HttpResponse()
+    if prefix:
+        response['X-Accel-Redirect'] = f"{prefix.rstrip('/')}/{quote(relative.as_posix())}"
+    else:
+        # mod_xsendfile 需以 XSendFilePath 放行备份根目录。
+        response['X-Sendfile'] = str(backup_root / relative)
+    response['Content-Disposition'] = content_disposition_header(True, Path(file_path).name)
+    # 由 nginx 按文件推断 Content-Type。
+    del response['Content-Type']
+    return response
+
+
+def backup_temp_dir() -> Path:
+    """远程/OSS 备份下载使用的临时目录。"""
+    backup_root = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
+    return backup_root / 'tmp'
+
+
+def is_temp_download(path) -> bool:
+    """判断路径是否为 prepare_backup_download_path 下载到临时目录的文件（纯字符串比较）。"""
+    return bool(path) and path.parent == backup_temp_dir()
+
+
+def prepare_backup_download_path(record, errors=None):
+    """
+    定位备份文件，必要时从远程/OSS 下载到临时目录
+
+    先尝试本地文件，再尝试远程存储，最后尝试对象存储。
+
+    Args:
+        record: 备份记录
+        errors: 可选列表，传入时追加各存储位置的失败原因（供管理后台提示）
+
+    Returns:
+        Path | None: 可读取的本地文件路径，均未命中时为 None
+    """
+    if errors is None:
+        errors = []
+    filenames = infer_backup_filenames(record)
+
+    if record.file_path:
+        file_path = Path(record.file_path)
+        # 单次 stat 同时判断是否存在及文件类型。
+        mode = _local_path_mode(file_path)
+        if stat.S_ISREG(mode):
+            return file_path
+        if stat.S_ISDIR(mode):
+            for name in filenames:
+                candidate = file_path / name
+                if stat.S_ISREG(_local_path_mode(candidate)):
+                    return candidate
+            errors.append(f"本地路径是目录: {file_path}")
+        else:
+            errors.append(f"本地文件不存在: {file_path}")
+    else:
+        errors.append("本地文件路径为空")
+
+    temp_dir = backup_temp_dir()
+    temp_path = None
+    if filenames:
+        temp_path = temp_dir / filenames[0]
+
+    if record.remote_path:
+        try:
+            remote_candidates = []
+            remote_path = record.remote_path
+            if Path(remote_path).suffix:
+                remote_candidates.append(remote_path)
+            else:
+                for name in filenames:
+                    remote_candidates.append(str(Path(remote_path) / name))
+
+            if record.remote_protocol:
+                client = get_pooled_client(
+                    protocol=record.remote_protocol,
+                    host=record.remote_host,
+                    port=record.remote_port,
+                    user=record.remote_user,
+                    password=record.get_decrypted_remote_password(),
+                    key_path=record.remote_key_path
+                )
+            else:
+                client = RemoteExecutor(record.instance)
+
+            if len(remote_candidates) > 1:
+                # 并发探测候选文件（池化客户端共用同一 SSH 连接，各探测独立开 SFTP 通道），
+                # 只下载按优先级命中的第一个。
+                with ThreadPoolExecutor(max_workers=min(4, len(remote_candidates))) as pool:
+                    found = list(pool.map(client.exists, remote_candidates))
+                remote_candidates = [
+                    candidate for candidate, hit in zip(remote_candidates, found) if hit
+                ][:1]
+
+            for remote_candidate in remote_candidates:
+                # 将远程候选文件下载到临时目录。
+                temp_path = temp_dir / Path(remote_candidate).name
+                _download_to_temp(client.download, remote_candidate, temp_path)
+                if _is_regular_file(temp_path):
+                    return temp_path
+            errors.append(f"远程下载后文件仍不存在: {temp_path}")
+        except Exception as exc:
+            errors.append(f"远程下载失败: {exc}")
+            logger.warning(f"远程备份下载失败: {exc}")
+    else:
+        errors.append("远程路径为空")
+
+    if record.object_storage_path:
+        oss_config = None
+        if record.strategy and (
+            record.strategy.oss_endpoint
+            or record.strategy.oss_access_key_id
+            or record.strategy.oss_bucket
+        ):
+            # 如策略配置了 OSS 信息，优先使用策略级别配置。
+            oss_config = {
+                'endpoint': record.strategy.oss_endpoint,
+                'access_key_id': record.strategy.oss_access_key_id,
+                'access_key_secret': record.strategy.get_decrypted_oss_access_key_secret(),
+                'bucket': record.strategy.oss_bucket,
+                'prefix': record.strategy.oss_prefix
+            }
+        uploader = get_object_storage_uploader(oss_config)
+        try:
+            object_path = record.object_storage_path
+            object_candidates = []
+            if object_path.endswith('/'):
+                for name in filenames:
+                    object_candidates.append(object_path.rstrip('/') + '/' + name)
+            else:
+                object_candidates.append(object_path)
+
+            for object_candidate in object_candidates:
+                # 下载对象存储候选文件到临时目录以便响应/恢复。
+                temp_path = temp_dir / Path(object_candidate).name
+                download = uploader.download
+                if (record.file_size_mb or 0) > _OSS_PARALLEL_DOWNLOAD_MIN_MB:
+                    # 大对象按字节区间并发拉取。
+                    download = uploader.download_parallel
+                _download_to_temp(download, object_candidate, temp_path)
+                if _is_regular_file(temp_path):
+                    return temp_path
+            errors.append(f"云存储下载后文件仍不存在: {temp_path}")
+        except Exception as exc:
+            errors.append(f"云存储下载失败: {exc}")
+            logger.warning(f"OSS 备份下载失败: {exc}")
+    else:
+        errors.append("云存储路径为空")
+
+    return None
+
+
 class BackupExecutor:
     """
     备份执行器
@@ -364,6 +1226,93 @@ class BackupExecutor:
             instance: MySQLInstance 实例
         """
         self.instance = instance
+        # 多库备份时复用的远程 SSH 会话与 OSS 客户端，close() 时统一释放。
+        self._remote_sessions = {}
+        self._oss_uploaders = {}
+        self._clients_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        """关闭本执行器持有的远程连接。"""
+        with self._clients_lock:
+            sessions = list(self._remote_sessions.values())
+            self._remote_sessions.clear()
+            self._oss_uploaders.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as exc:
+                logger.warning(f"关闭远程连接失败: {exc}")
+
+    def _get_remote_session(self, remote_config: dict | None) -> RemoteExecutor:
+        """按远程配置获取（必要时建立）复用的 SSH 会话，未提供配置时使用实例 SSH 凭据。"""
+        if remote_config is None:
+            key = ('instance',)
+        else:
+            key = (
+                remote_config.get('host'), remote_config.get('port'),
+                remote_config.get('user'), remote_config.get('key_path')
+            )
+        with self._clients_lock:
+            session = self._remote_sessions.get(key)
+            if session is None:
+                if remote_config is None:
+                    session = RemoteExecutor(self.instance)
+                else:
+                    session = RemoteExecutor(
+                        host=remote_config.get('host'),
+                        port=remote_config.get('port'),
+                        user=remote_config.get('user'),
+                        password=remote_config.get('password'),
+                        key_path=remote_config.get('key_path')
+                    )
+                session = session.__enter__()
+                self._remote_sessions[key] = session
+        return session
+
+    def _get_stream_target(
+        self,
+        store_local,
+        store_remote,
+        store_oss,
+        remote_storage_path,
+        remote_config,
+        oss_config
+    ):
+        """
+        仅存储到单一 SSH 远端或 OSS 时返回流式目标，dump 输出不落地本地文件
+
+        FTP/HTTP、多目标或需要本地保留时返回 None，沿用先落地再上传的流程。
+        """
+        if store_local or store_remote == store_oss:
+            return None
+        if store_oss:
+            uploader = self._get_oss_uploader(oss_config)
+            return _OssStreamTarget(uploader, self.instance.alias) if uploader._is_ready() else None
+        if remote_config and (remote_config.get('protocol') or 'ssh').lower() != 'ssh':
+            return None
+        remote_path = self._build_remote_path('_', remote_storage_path)
+        if not remote_path:
+            return None
+        session = self._get_remote_session(remote_config)
+        if not session._is_remote():
+            return None
+        return _SftpStreamTarget(session, str(Path(remote_path).parent).replace('\\', '/'))
+
+    def _get_oss_uploader(self, config: dict | None) -> ObjectStorageUploader:
+        """按 OSS 配置获取复用的上传器。"""
+        key = tuple(sorted((config or {}).items()))
+        with self._clients_lock:
+            uploader = self._oss_uploaders.get(key)
+            if uploader is None:
+                uploader = ObjectStorageUploader(config=config)
+                self._oss_uploaders[key] = uploader
+        return uploader
 
     def _get_remote_backup_path(
         self,
@@ -414,14 +1363,8 @@ class BackupExecutor:
             if not remote_path:
                 return None
             if protocol == 'ssh':
-                # 通过临时执行器进行 SSH 上传。
-                executor = RemoteExecutor(
-                    host=remote_config.get('host'),
-                    port=remote_config.get('port'),
-                    user=remote_config.get('user'),
-                    password=remote_config.get('password'),
-                    key_path=remote_config.get('key_path')
-                )
+                # 复用同一 SSH 会话完成建目录与上传，多库备份只握手一次。
+                executor = self._get_remote_session(remote_config)
                 remote_dir = str(Path(remote_path).parent).replace('\\', '/')
                 executor.run(f"mkdir -p {shlex.quote(remote_dir)}")
                 executor.upload(local_path, remote_path)
@@ -449,7 +1392,7 @@ class BackupExecutor:
 
     def _upload_to_object_storage(self, local_path: Path, filename: str, config: dict | None = None) -> str | None:
         # 对象存储上传尽力而为，失败只记录日志。
-        uploader = ObjectStorageUploader(config=config)
+        uploader = self._get_oss_uploader(config)
         try:
             return uploader.upload(local_path, self.instance.alias, filename)
         except Exception as exc:
@@ -468,7 +1411,8 @@ class BackupExecutor:
         store_oss=False,
         remote_storage_path=None,
         remote_config=None,
-        oss_config=None
+        oss_config=None,
+        compression_algo=None
     ):
         """
         执行备份
@@ -477,6 +1421,7 @@ class BackupExecutor:
             database_name: 数据库名称，为 None 表示备份所有数据库
             compress: 是否压缩备份文件
             storage_path: 存储路径，为 None 则使用默认路径
+            compression_algo: 逻辑备份压缩算法（zstd/gzip），为 None 使用配置默认值
             
         Returns:
             dict: 包含备份结果的字典
@@ -493,15 +1438,17 @@ class BackupExecutor:
                     'error_message': '热备/冷备/增量备份不支持指定单个数据库'
                 }
 
+            alias = self.instance.alias
+
             # 1. 生成备份文件名
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = time.strftime('%Y%m%d_%H%M%S')
             db_suffix = database_name if database_name else 'all'
-            filename = f"{self.instance.alias}_{db_suffix}_{timestamp}.sql"
+            filename = f"{alias}_{db_suffix}_{timestamp}.sql"
             
             # 2. 确定存储路径
             if storage_path is None:
                 backup_root = getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups')
-                storage_path = Path(backup_root) / self.instance.alias
+                storage_path = Path(backup_root) / alias
             else:
                 storage_path = Path(storage_path)
             
@@ -523,7 +1470,8 @@ class BackupExecutor:
                     store_oss,
                     remote_storage_path,
                     remote_config,
-                    oss_config
+                    oss_config,
+                    compression_algo
                 )
 
             if backup_type in ['hot']:
@@ -614,53 +1562,34 @@ class BackupExecutor:
 
     def _supports_ssl_mode(self, dump_bin: str) -> bool:
         """检测 mysqldump 是否支持 --ssl-mode 选项。"""
-        try:
-            # 通过帮助输出检测是否支持参数。
-            result = subprocess.run(
-                [dump_bin, '--help'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            output = f"{result.stdout}\n{result.stderr}"
-            return 'ssl-mode' in output
-        except Exception:
-            return False
+        return _binary_supports_ssl_mode(dump_bin)
 
-    def _build_mysqldump_command(self, database_name, output_file, dump_bin: str):
+    def _build_mysqldump_command(self, database_name, dump_bin: str) -> list[str]:
         """
-        构建 mysqldump 命令
-        
+        构建 mysqldump 参数列表
+
         Args:
             database_name: 数据库名称，为 None 表示所有数据库
-            output_file: 输出文件路径
-            
+            dump_bin: 导出命令路径
+
         Returns:
-            str: mysqldump 命令
+            list[str]: mysqldump argv（不经 shell 解析，输出由调用方重定向）
         """
-        # 获取解密后的密码
-        password = self.instance.get_decrypted_password()
-        
-        # 基础命令
-        cmd_parts = [
+        # 基础命令；密码通过 MYSQL_PWD 环境变量传入，避免出现在进程列表中。
+        argv = [
             dump_bin,
-            f'-h {self.instance.host}',
-            f'-P {self.instance.port}',
-            f'-u {self.instance.username}',
+            '-h', self.instance.host,
+            '-P', str(self.instance.port),
+            '-u', self.instance.username,
         ]
-        
-        # 添加密码（使用环境变量更安全，但为简化直接在命令中）
-        if password:
-            # 注意：命令行密码不安全，但为简化保留。
-            cmd_parts.append(f'-p"{password}"')
 
         # 安全传输配置（默认禁用以兼容自签名证书）
         ssl_mode = getattr(settings, 'MYSQL_DUMP_SSL_MODE', 'DISABLED')
         if ssl_mode:
             if self._supports_ssl_mode(dump_bin):
-                cmd_parts.append(f'--ssl-mode={ssl_mode}')
+                argv.append(f'--ssl-mode={ssl_mode}')
             elif str(ssl_mode).upper() in ('DISABLED', 'DISABLE', 'OFF', '0'):
-                cmd_parts.append('--skip-ssl')
+                argv.append('--skip-ssl')
             else:
                 logger.warning(
                     "mysqldump 不支持 --ssl-mode，已忽略 SSL 配置: %s",
@@ -670,34 +1599,89 @@ class BackupExecutor:
         ssl_ca = getattr(settings, 'MYSQL_DUMP_SSL_CA', '')
         if ssl_ca:
             # 如配置了 CA，则传入。
-            cmd_parts.append(f'--ssl-ca="{ssl_ca}"')
-        
+            argv.append(f'--ssl-ca={ssl_ca}')
+
         # 添加常用选项
-        cmd_parts.extend([
+        argv.extend([
             '--single-transaction',  # 对于InnoDB，保证一致性备份
             '--quick',  # 快速导出，不缓冲到内存
             '--lock-tables=false',  # 不锁表
         ])
-        
+
         # 指定数据库
         if database_name:
-            cmd_parts.append(f'--databases {shlex.quote(database_name)}')
+            argv.extend(['--databases', database_name])
         else:
             include_system = getattr(settings, 'MYSQL_DUMP_INCLUDE_SYSTEM_DATABASES', False)
             if include_system:
                 # 显式开启时包含系统库。
-                cmd_parts.append('--all-databases')
+                argv.append('--all-databases')
             else:
                 dbs = self._get_user_databases()
                 if not dbs:
                     raise ValueError('未找到可备份的非系统数据库')
-                safe_dbs = ' '.join(shlex.quote(db) for db in dbs)
-                cmd_parts.append(f'--databases {safe_dbs}')
-        
-        # 输出重定向
-        cmd = ' '.join(cmd_parts) + f' > "{output_file}"'
-        
-        return cmd
+                argv.append('--databases')
+                argv.extend(dbs)
+
+        return argv
+
+    def _build_mysql_env(self) -> dict:
+        """构建子进程环境变量，通过 MYSQL_PWD 传递密码。"""
+        env = dict(os.environ)
+        password = _get_instance_password(self.instance)
+        if password:
+            env['MYSQL_PWD'] = password
+        return env
+
+    def _run_dump(self, dump_argv, sink, discard, timeout=3600):
+        """
+        运行 mysqldump，并把 stdout 交给 sink 单次流式写出
+
+        直接以 argv 启动，无需经过 /bin/sh；stderr 写入临时文件，避免管道写满阻塞。
+
+        Args:
+            dump_argv: mysqldump 参数列表
+            sink: 接收 stdout 流、返回 (输出位置, SHA-256, 字节数) 的函数
+            discard: dump 失败时清理已写出输出的函数，参数为输出位置
+
+        Returns:
+            tuple: (返回码, stderr 字节串, 输出位置, SHA-256, 字节数)
+        """
+        timed_out = threading.Event()
+        with tempfile.TemporaryFile() as err_file:
+            proc = subprocess.Popen(
+                dump_argv,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=err_file,
+                env=self._build_mysql_env()
+            )
+
+            def kill_on_timeout():
+                timed_out.set()
+                proc.kill()
+
+            # 超时后终止子进程，stdout 随之结束，流式写入自然退出。
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.start()
+            location = None
+            sha256 = ''
+            size = 0
+            try:
+                location, sha256, size = sink(proc.stdout)
+            finally:
+                timer.cancel()
+                proc.stdout.close()
+                returncode = proc.wait()
+                if location and (returncode != 0 or timed_out.is_set()):
+                    # dump 失败时不保留不完整的备份输出。
+                    discard(location)
+            err_file.seek(0)
+            stderr = err_file.read()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(dump_argv, timeout)
+        return returncode, stderr, location, sha256, size
 
     def _execute_logical_backup(
         self,
@@ -710,7 +1694,8 @@ class BackupExecutor:
         store_oss,
         remote_storage_path,
         remote_config,
-        oss_config
+        oss_config,
+        compression_algo=None
     ):
         """执行逻辑备份（mysqldump）"""
         dump_bin = self._get_dump_binary()
@@ -722,43 +1707,60 @@ class BackupExecutor:
 
         file_path = storage_path / filename
         try:
-            # 构建 mysqldump 命令（含 SSL 与库过滤）。
-            dump_cmd = self._build_mysqldump_command(database_name, str(file_path), dump_bin)
+            # 构建 mysqldump 参数（含 SSL 与库过滤）。
+            dump_argv = self._build_mysqldump_command(database_name, dump_bin)
         except ValueError as exc:
             return {
                 'success': False,
                 'error_message': str(exc)
             }
 
-        logger.info(f"开始逻辑备份: {self.instance.alias}")
-        result = subprocess.run(
-            dump_cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=3600  # 1小时超时
+        compression_algo = resolve_compression_algo(compression_algo)
+        stream_target = self._get_stream_target(
+            store_local, store_remote, store_oss, remote_storage_path, remote_config, oss_config
         )
+        if stream_target is not None:
+            # 只需存到单一远端时直接流式写出，不占用本地磁盘，也省去一次读回上传。
+            def sink(f_in):
+                _, checksum = _stream_to_target(
+                    f_in, stream_target.open, filename, compress, compression_algo
+                )
+                return stream_target.location, checksum.sha256.hexdigest(), checksum.size
+
+            def discard(_location):
+                stream_target.discard()
+        else:
+            def sink(f_in):
+                path, digest = _stream_to_file(f_in, file_path, compress, compression_algo)
+                return path, digest, path.stat().st_size
+
+            def discard(path):
+                path.unlink(missing_ok=True)
 
-        if result.returncode != 0:
-            error_msg = result.stderr or "备份命令执行失败"
+        logger.info(f"开始逻辑备份: {self.instance.alias}")
+        returncode, stderr, final_path, sha256, size = self._run_dump(dump_argv, sink, discard)
+
+        if returncode != 0:
+            error_msg = stderr.decode('utf-8', 'replace') or "备份命令执行失败"
             logger.error(f"备份失败: {error_msg}")
             return {
                 'success': False,
                 'error_message': error_msg
             }
 
-        final_path = file_path
-        if compress:
-            # 压缩 SQL 文件，成功后删除原文件。
-            compressed_path = self._compress_file(file_path)
-            if compressed_path:
-                final_path = compressed_path
-                if file_path.exists():
-                    file_path.unlink()
-
-        file_size_mb = final_path.stat().st_size / (1024 * 1024)
+        file_size_mb = size / (1024 * 1024)
         logger.info(f"备份成功: {final_path}, 大小: {file_size_mb:.2f} MB")
 
+        if stream_target is not None:
+            return {
+                'success': True,
+                'file_path': '',
+                'file_size_mb': round(file_size_mb, 2),
+                'sha256': sha256,
+                'remote_path': final_path if store_remote else '',
+                'object_storage_path': final_path if store_oss else ''
+            }
+
         remote_path = None
         remote_error = None
         if store_remote:
@@ -791,22 +1793,22 @@ class BackupExecutor:
 
         file_path_value = str(final_path) if store_local else ''
         if not store_local:
-            # 未启用本地存储时删除本地文件。
-            if final_path.exists():
-                final_path.unlink()
+            # 未启用本地存储时删除本地文件（单次 unlink，不预先 exists）。
+            final_path.unlink(missing_ok=True)
             final_path = Path('')
 
         return {
             'success': True,
             'file_path': file_path_value,
             'file_size_mb': round(file_size_mb, 2),
+            'sha256': sha256,
             'remote_path': remote_path or '',
             'object_storage_path': object_storage_path or ''
         }
 
     def _build_xtrabackup_command(self, target_dir, incremental_base_dir=None):
         """构建 xtrabackup 命令"""
-        password = self.instance.get_decrypted_password()
+        password = _get_instance_password(self.instance)
         cmd_parts = [
             shlex.quote(self.instance.xtrabackup_bin or 'xtrabackup'),
             '--backup',
@@ -913,6 +1915,7 @@ class BackupExecutor:
             executor.run(f"rm -f {shlex.quote(remote_archive)}")
 
         file_size_mb = local_path.stat().st_size / (1024 * 1024)
+        sha256 = compute_file_sha256(local_path)
         if store_remote and remote_config:
             try:
                 # 如配置外部远程存储则上传。
@@ -934,14 +1937,15 @@ class BackupExecutor:
             ) or ''
 
         file_path_value = str(local_path) if store_local else ''
-        if not store_local and local_path.exists():
+        if not store_local:
             # 未保存本地时删除本地副本。
-            local_path.unlink()
+            local_path.unlink(missing_ok=True)
             local_path = Path('')
         return {
             'success': True,
             'file_path': file_path_value,
             'file_size_mb': round(file_size_mb, 2),
+            'sha256': sha256,
             'remote_path': remote_keep_path or '',
             'object_storage_path': object_storage_path or ''
         }
@@ -1023,6 +2027,7 @@ class BackupExecutor:
             executor.run(f"rm -f {shlex.quote(remote_archive)}")
 
         file_size_mb = local_path.stat().st_size / (1024 * 1024)
+        sha256 = compute_file_sha256(local_path)
         if store_remote and remote_config:
             try:
                 # 如配置外部远程存储则上传。
@@ -1044,14 +2049,15 @@ class BackupExecutor:
             ) or ''
 
         file_path_value = str(local_path) if store_local else ''
-        if not store_local and local_path.exists():
+        if not store_local:
             # 未保存本地时删除本地副本。
-            local_path.unlink()
+            local_path.unlink(missing_ok=True)
             local_path = Path('')
         return {
             'success': True,
             'file_path': file_path_value,
             'file_size_mb': round(file_size_mb, 2),
+            'sha256': sha256,
             'remote_path': remote_keep_path or '',
             'object_storage_path': object_storage_path or ''
         }
@@ -1134,6 +2140,7 @@ class BackupExecutor:
             executor.run(f"rm -f {shlex.quote(remote_archive)}")
 
         file_size_mb = local_path.stat().st_size / (1024 * 1024)
+        sha256 = compute_file_sha256(local_path)
         if store_remote and remote_config:
             try:
                 # 如配置外部远程存储则上传。
@@ -1155,41 +2162,18 @@ class BackupExecutor:
             ) or ''
 
         file_path_value = str(local_path) if store_local else ''
-        if not store_local and local_path.exists():
+        if not store_local:
             # 未保存本地时删除本地副本。
-            local_path.unlink()
+            local_path.unlink(missing_ok=True)
             local_path = Path('')
         return {
             'success': True,
             'file_path': file_path_value,
             'file_size_mb': round(file_size_mb, 2),
+            'sha256': sha256,
             'remote_path': remote_keep_path or '',
             'object_storage_path': object_storage_path or ''
         }
-    
-    def _compress_file(self, file_path):
-        """
-        压缩备份文件
-        
-        Args:
-            file_path: Path 对象，原始文件路径
-            
-        Returns:
-            Path: 压缩后的文件路径，失败则返回 None
-        """
-        try:
-            compressed_path = Path(str(file_path) + '.gz')
-            
-            with open(file_path, 'rb') as f_in:
-                with gzip.open(compressed_path, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
-            
-            logger.info(f"文件压缩成功: {compressed_path}")
-            return compressed_path
-            
-        except Exception as e:
-            logger.error(f"文件压缩失败: {str(e)}")
-            return None
 
 
 class RestoreExecutor:
@@ -1221,49 +2205,93 @@ class RestoreExecutor:
                 - success: 是否成功
                 - error_message: 错误信息（如果失败）
         """
+        file_path = Path(backup_file_path)
+        
+        # 1. 验证备份文件存在
+        if not file_path.exists():
+            return {
+                'success': False,
+                'error_message': f"备份文件不存在: {backup_file_path}"
+            }
+        
+        # 2. 压缩文件边解压边写入 mysql，不再解压到临时文件。
+        compression = file_path.suffix if file_path.suffix in ('.gz', '.zst') else None
+        logger.info(f"开始恢复: {self.instance.alias} - {backup_file_path}")
         try:
-            file_path = Path(backup_file_path)
-            
-            # 1. 验证备份文件存在
-            if not file_path.exists():
-                return {
-                    'success': False,
-                    'error_message': f"备份文件不存在: {backup_file_path}"
-                }
+            with open(file_path, 'rb') as f_in:
+                _fadvise(f_in, 'POSIX_FADV_SEQUENTIAL')
+                return self.execute_restore_stream(f_in, target_database, compression)
+        except OSError as e:
+            error_msg = f"恢复执行异常: {str(e)}"
+            logger.exception(error_msg)
+            return {
+                'success': False,
+                'error_message': error_msg
+            }
+    
+    def execute_restore_stream(self, file_obj, target_database=None, compression=None,
+                               timeout=3600, chunk_size=1024 * 1024):
+        """
+        从文件对象流式恢复
+        
+        未压缩且带真实文件描述符的输入直接作为 mysql 的 stdin；
+        压缩或内存中的输入按块解压后写入 mysql 管道，不落地临时文件。
+        
+        Args:
+            file_obj: 可读的二进制文件对象（本地文件、上传文件等）
+            target_database: 目标数据库名称，为 None 则恢复到原数据库
+            compression: 压缩后缀（.gz/.zst），None 表示未压缩
+            timeout: 超时时间（秒）
+            chunk_size: 管道写入块大小
             
-            # 2. 解压文件（如果需要）
-            temp_file = None
-            if file_path.suffix == '.gz':
-                # 在同目录解压到临时文件。
-                temp_file = self._decompress_file(file_path)
-                if not temp_file:
-                    return {
-                        'success': False,
-                        'error_message': "备份文件解压失败"
-                    }
-                restore_file = temp_file
+        Returns:
+            dict: 包含恢复结果的字典
+                - success: 是否成功
+                - error_message: 错误信息（如果失败）
+        """
+        try:
+            if compression == '.zst':
+                if zstandard is None:
+                    raise RuntimeError('未安装 zstandard，无法解压 .zst 备份')
+                reader = zstandard.ZstdDecompressor().stream_reader(file_obj, closefd=False)
+            elif compression == '.gz':
+                reader = gzip.GzipFile(fileobj=file_obj, mode='rb')
             else:
-                restore_file = file_path
+                reader = None
             
-            # 3. 构建 mysql 恢复命令
-            restore_cmd = self._build_mysql_command(str(restore_file), target_database)
-            
-            # 4. 执行恢复
-            logger.info(f"开始恢复: {self.instance.alias} - {backup_file_path}")
-            result = subprocess.run(
-                restore_cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=3600  # 1小时超时
-            )
+            restore_argv = self._build_mysql_command(target_database)
+            stdin_fd = None
+            if reader is None:
+                try:
+                    stdin_fd = file_obj.fileno()
+                except (AttributeError, OSError, ValueError):
+                    stdin_fd = None
             
-            # 清理临时文件
-            if temp_file and temp_file.exists():
-                temp_file.unlink()
+            # stderr 写入临时文件，避免写 stdin 时 stderr 管道写满互相阻塞。
+            with tempfile.TemporaryFile() as stderr_file:
+                if stdin_fd is not None:
+                    # 真实文件直接交给 mysql 读取，stdout 丢弃。
+                    returncode = subprocess.run(
+                        restore_argv,
+                        stdin=stdin_fd,
+                        stdout=subprocess.DEVNULL,
+                        stderr=stderr_file,
+                        env=self._build_mysql_env(),
+                        timeout=timeout
+                    ).returncode
+                else:
+                    try:
+                        returncode = self._pipe_to_mysql(
+                            restore_argv, reader or file_obj, stderr_file, timeout, chunk_size
+                        )
+                    finally:
+                        if reader is not None:
+                            reader.close()
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
             
-            if result.returncode != 0:
-                error_msg = result.stderr or "恢复命令执行失败"
+            if returncode != 0:
+                error_msg = stderr.decode('utf-8', 'replace') or "恢复命令执行失败"
                 logger.error(f"恢复失败: {error_msg}")
                 return {
                     'success': False,
@@ -1287,75 +2315,80 @@ class RestoreExecutor:
                 'success': False,
                 'error_message': error_msg
             }
+    
+    def _pipe_to_mysql(self, restore_argv, reader, stderr_file, timeout, chunk_size) -> int:
+        """按块把 reader 的数据写入 mysql stdin，返回退出码；超时抛出 TimeoutExpired。"""
+        timed_out = threading.Event()
+        proc = subprocess.Popen(
+            restore_argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_file,
+            env=self._build_mysql_env()
+        )
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        # 超时后终止 mysql：即使 mysql 卡在锁等待、不再读取 stdin，
+        # 阻塞在满管道上的写入也会随之以 BrokenPipeError 返回。
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+        try:
+            try:
+                while not timed_out.is_set() and (chunk := reader.read(chunk_size)):
+                    proc.stdin.write(chunk)
+                proc.stdin.close()
+            except BrokenPipeError:
+                # mysql 已退出（提前失败或被超时终止），原因见退出码与 stderr。
+                pass
+            returncode = proc.wait()
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            timer.cancel()
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(restore_argv, timeout)
+        return returncode
 
     def _supports_ssl_mode(self, mysql_bin: str) -> bool:
         """检测 mysql 是否支持 --ssl-mode 选项。"""
-        try:
-            # 通过 mysql 帮助输出检测 SSL 参数。
-            result = subprocess.run(
-                [mysql_bin, '--help'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            output = f"{result.stdout}\n{result.stderr}"
-            return 'ssl-mode' in output
-        except Exception:
-            return False
-    
-    def _decompress_file(self, compressed_path):
-        """
-        解压备份文件
-        
-        Args:
-            compressed_path: Path 对象，压缩文件路径
-            
-        Returns:
-            Path: 解压后的临时文件路径，失败则返回 None
-        """
-        try:
-            # 在同目录创建临时文件
-            temp_path = compressed_path.parent / f"temp_{compressed_path.stem}"
-            
-            with gzip.open(compressed_path, 'rb') as f_in:
-                with open(temp_path, 'wb') as f_out:
-                    # 流式复制，避免大文件占内存。
-                    shutil.copyfileobj(f_in, f_out)
-            
-            logger.info(f"文件解压成功: {temp_path}")
-            return temp_path
-            
-        except Exception as e:
-            logger.error(f"文件解压失败: {str(e)}")
-            return None
+        return _binary_supports_ssl_mode(mysql_bin)
     
-    def _build_mysql_command(self, input_file, target_database=None):
+    def _build_mysql_env(self) -> dict:
+        """构建子进程环境变量，通过 MYSQL_PWD 传递密码。"""
+        env = dict(os.environ)
+        password = _get_instance_password(self.instance)
+        if password:
+            env['MYSQL_PWD'] = password
+        return env
+
+    def _build_mysql_command(self, target_database=None) -> list[str]:
         """
-        构建 mysql 恢复命令
+        构建 mysql 恢复命令参数
         
         Args:
-            input_file: 输入文件路径
             target_database: 目标数据库名称
             
         Returns:
-            str: mysql 命令
+            list[str]: mysql 命令参数，备份文件通过 stdin 传入
         """
-        # 获取解密后的密码
-        password = self.instance.get_decrypted_password()
-        
-        # 基础命令
+        # 基础命令（密码通过 MYSQL_PWD 传递）
         mysql_bin = 'mysql'
         cmd_parts = [
             mysql_bin,
-            f'-h {self.instance.host}',
-            f'-P {self.instance.port}',
-            f'-u {self.instance.username}',
+            '-h', str(self.instance.host),
+            '-P', str(self.instance.port),
+            '-u', str(self.instance.username),
         ]
-        
-        # 添加密码
-        if password:
-            # 注意：命令行密码不安全，但与 mysqldump 保持一致。
-            cmd_parts.append(f'-p"{password}"')
 
         # 安全传输配置（默认禁用以兼容自签名证书）
         ssl_mode = getattr(settings, 'MYSQL_DUMP_SSL_MODE', 'DISABLED')
@@ -1365,7 +2398,7 @@ class RestoreExecutor:
                 ssl_ca = getattr(settings, 'MYSQL_DUMP_SSL_CA', '')
                 if ssl_ca:
                     # 显式 CA 用于证书校验。
-                    cmd_parts.append(f'--ssl-ca="{ssl_ca}"')
+                    cmd_parts.append(f'--ssl-ca={ssl_ca}')
             elif str(ssl_mode).upper() in ('DISABLED', 'DISABLE', 'OFF', '0'):
                 cmd_parts.append('--skip-ssl')
             else:
@@ -1378,10 +2411,11 @@ class RestoreExecutor:
         if target_database:
             cmd_parts.append(target_database)
         
-        # 输入重定向
-        cmd = ' '.join(cmd_parts) + f' < "{input_file}"'
-        
-        return cmd
+        return cmd_parts
+
+
+# 同步 Celery Beat 时批量读写 PeriodicTask 的批大小，控制单条 SQL 的规模。
+_BEAT_SYNC_BATCH_SIZE = 500
 
 
 class StrategyManager:
@@ -1402,30 +2436,81 @@ class StrategyManager:
                 - updated: 更新的任务数
                 - deleted: 删除的任务数
         """
-        from apps.backups.models import BackupStrategy
-        
-        created_count = 0
-        updated_count = 0
-        deleted_count = 0
-        
+
+        task_path = 'apps.backups.tasks.execute_backup_task'
+
         try:
-            # 1. 获取所有启用的策略
-            enabled_strategies = BackupStrategy.objects.filter(is_enabled=True)
-            
-            # 2. 为每个策略创建或更新 PeriodicTask
-            for strategy in enabled_strategies:
-                task_created = StrategyManager._create_or_update_periodic_task(strategy)
-                if task_created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-            
-            # 3. 删除已禁用策略的任务
-            disabled_strategies = BackupStrategy.objects.filter(is_enabled=False)
-            for strategy in disabled_strategies:
-                if StrategyManager._delete_periodic_task(strategy):
-                    deleted_count += 1
-            
+            with transaction.atomic():
+                # 1. 一次性读取策略与已有的调度任务，在内存中计算差异。
+                strategies = BackupStrategy.objects.filter(is_enabled=True).only(
+                    'id', 'cron_expression'
+                )
+                existing = {
+                    task.name: task
+                    for task in PeriodicTask.objects.filter(
+                        name__startswith='backup_strategy_'
+                    ).select_related('crontab')
+                }
+
+                # 相同调度只查询/创建一次 CrontabSchedule。
+                cron_cache = {}
+                to_create = []
+                to_update = []
+                desired_names = set()
+
+                # 2. 启用的策略需要存在且与当前配置一致的 PeriodicTask。
+                for strategy in strategies.iterator(chunk_size=_BEAT_SYNC_BATCH_SIZE):
+                    task_name = f"backup_strategy_{strategy.id}"
+                    desired_names.add(task_name)
+
+                    cron_schedule = StrategyManager._parse_cron_expression(
+                        strategy.cron_expression, cron_cache
+                    )
+                    task_kwargs = json.dumps({'strategy_id': strategy.id})
+
+                    task = existing.get(task_name)
+                    if task is None:
+                        to_create.append(PeriodicTask(
+                            name=task_name,
+                            task=task_path,
+                            crontab=cron_schedule,
+                            kwargs=task_kwargs,
+                            enabled=True,
+                        ))
+                    elif (
+                        task.crontab_id != cron_schedule.id
+                        or task.kwargs != task_kwargs
+                        or task.task != task_path
+                        or not task.enabled
+                    ):
+                        task.crontab = cron_schedule
+                        task.kwargs = task_kwargs
+                        task.task = task_path
+                        task.enabled = True
+                        to_update.append(task)
+
+                # 3. 已禁用或已删除策略的任务一并移除。
+                to_delete = [name for name in existing if name not in desired_names]
+
+                if to_create:
+                    PeriodicTask.objects.bulk_create(
+                        to_create, batch_size=_BEAT_SYNC_BATCH_SIZE, ignore_conflicts=True
+                    )
+                if to_update:
+                    PeriodicTask.objects.bulk_update(
+                        to_update, ['crontab', 'kwargs', 'task', 'enabled'],
+                        batch_size=_BEAT_SYNC_BATCH_SIZE
+                    )
+                if to_delete:
+                    PeriodicTask.objects.filter(name__in=to_delete).delete()
+
+                # 批量操作不触发模型信号，需手动通知 Beat 重新加载调度。
+                if to_create or to_update or to_delete:
+                    PeriodicTasks.update_changed()
+
+            created_count = len(to_create)
+            updated_count = len(to_update)
+            deleted_count = len(to_delete)
             logger.info(f"策略同步完成: 创建 {created_count}, 更新 {updated_count}, 删除 {deleted_count}")
             
             return {
@@ -1439,18 +2524,39 @@ class StrategyManager:
             raise
     
     @staticmethod
-    def _create_or_update_periodic_task(strategy):
+    def sync_one(strategy):
+        """
+        只同步单个策略对应的 PeriodicTask
+        
+        启用时创建/更新任务；禁用时仅置为 enabled=False（保留行，
+        下次全量同步时再清理），最后通知 Beat 重新加载调度。
+        
+        Args:
+            strategy: BackupStrategy 实例（is_enabled 为期望状态）
+        """
+        with transaction.atomic():
+            if strategy.is_enabled:
+                StrategyManager._create_or_update_periodic_task(strategy)
+            else:
+                PeriodicTask.objects.filter(
+                    name=f"backup_strategy_{strategy.id}"
+                ).update(enabled=False)
+            PeriodicTasks.update_changed()
+    
+    @staticmethod
+    def _create_or_update_periodic_task(strategy, cron_cache=None):
         """
         为策略创建或更新 PeriodicTask
         
         Args:
             strategy: BackupStrategy 实例
+            cron_cache: 可选的 CrontabSchedule 缓存，批量处理时复用
             
         Returns:
             bool: True 表示创建了新任务，False 表示更新了现有任务
         """
         # 解析 Cron 表达式
-        cron_schedule = StrategyManager._parse_cron_expression(strategy.cron_expression)
+        cron_schedule = StrategyManager._parse_cron_expression(strategy.cron_expression, cron_cache)
         
         # 任务名称
         task_name = f"backup_strategy_{strategy.id}"
@@ -1489,12 +2595,13 @@ class StrategyManager:
         return deleted > 0
     
     @staticmethod
-    def _parse_cron_expression(cron_expr):
+    def _parse_cron_expression(cron_expr, cache=None):
         """
         解析 Cron 表达式并创建 CrontabSchedule
         
         Args:
             cron_expr: Cron 表达式字符串，如 "0 2 * * *"
+            cache: 可选的字典缓存，键为 (分, 时, 日, 月, 周)
             
         Returns:
             CrontabSchedule: Crontab 调度对象
@@ -1504,6 +2611,10 @@ class StrategyManager:
         if len(parts) != 5:
             raise ValueError(f"无效的 Cron 表达式: {cron_expr}")
         
+        key = tuple(parts)
+        if cache is not None and key in cache:
+            return cache[key]
+
         minute, hour, day_of_month, month_of_year, day_of_week = parts
         
         # 创建或获取 CrontabSchedule
@@ -1515,5 +2626,7 @@ class StrategyManager:
             month_of_year=month_of_year,
             day_of_week=day_of_week,
         )
-        
+
+        if cache is not None:
+            cache[key] = schedule
         return schedule
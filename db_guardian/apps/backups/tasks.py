@@ -6,13 +6,179 @@
 from celery import shared_task
 from django.utils import timezone
 from django.conf import settings
+from django.db import DatabaseError, models, transaction
+from django.core.cache import cache
 from datetime import timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import hashlib
+import json
 import logging
 import os
+import zlib
+
+from apps.backups.models import BackupStrategy, BackupRecord, BackupOneOffTask
+from apps.backups.services import (
+    BackupExecutor, StrategyManager, COMPRESSED_MAGICS, compute_file_sha256, zstandard
+)
+from apps.instances.models import MySQLInstance, PasswordEncryptor
 
 logger = logging.getLogger(__name__)
 
+GZIP_MAGIC = next(magic for magic, suffix in COMPRESSED_MAGICS if suffix == '.gz')
+ZSTD_MAGIC = next(magic for magic, suffix in COMPRESSED_MAGICS if suffix == '.zst')
+
+# 存储模式对应的 (本地, 远程, 对象存储) 开关；mysql_host 与 remote_server 都经由远程通道上传。
+STORAGE_MODE_FLAGS = {
+    'default': (True, False, False),
+    'mysql_host': (False, True, False),
+    'remote_server': (False, True, False),
+    'oss': (False, False, True),
+}
+
+# 临时文件目录与默认保留时长在进程内不变，导入时解析一次。
+_BACKUP_ROOT = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
+# uploads/ 已不再写入，仍纳入清理以回收旧版本遗留的上传文件。
+_TEMP_DIRS = (_BACKUP_ROOT / 'tmp', _BACKUP_ROOT / 'uploads')
+_DEFAULT_TEMP_HOURS = getattr(settings, 'BACKUP_TEMP_RETENTION_HOURS', 24)
+
+# 清理/校验类任务遇到数据库瞬时故障（断连、死锁等）时指数退避自动重试。
+DB_RETRY_OPTIONS = {
+    'bind': True,
+    'autoretry_for': (DatabaseError,),
+    'retry_backoff': 10,
+    'retry_backoff_max': 600,
+    'retry_jitter': True,
+    'max_retries': 5,
+}
+
+
+def _safe_unlink(file_path, size_mb=None):
+    """
+    删除单个本地备份文件
+
+    Args:
+        file_path: 备份文件路径
+        size_mb: 记录中已保存的文件大小（MB），未知时才 stat 文件
+
+    Returns:
+        float: 释放的空间（MB），文件不存在或删除失败时为 0
+    """
+    if not file_path:
+        return 0.0
+    try:
+        # EAFP：直接 unlink，文件缺失由 FileNotFoundError 处理，不再预先 exists。
+        file_size = size_mb if size_mb else os.stat(file_path).st_size / (1024 * 1024)
+        os.unlink(file_path)
+        logger.info(f"删除备份文件: {file_path}")
+        return file_size
+    except FileNotFoundError:
+        return 0.0
+    except Exception as e:
+        logger.error(f"删除文件失败 {file_path}: {str(e)}")
+        return 0.0
+
+
+def _unlink_backup_files(file_paths, sizes_mb=None):
+    """
+    使用线程池并发删除备份文件
+
+    unlink 在网络/对象存储挂载盘上主要耗在等待 I/O，系统调用期间释放 GIL，
+    并发删除可显著缩短清理耗时。
+
+    Args:
+        file_paths: 备份文件路径列表
+        sizes_mb: 与 file_paths 对应的已知大小（MB），提供时跳过 stat
+
+    Returns:
+        float: 释放的总空间（MB）
+    """
+    if sizes_mb is None:
+        return sum(_parallel_map(_safe_unlink, file_paths))
+    return sum(_parallel_map(lambda item: _safe_unlink(*item), zip(file_paths, sizes_mb)))
+
+
+def _unlink_temp_file(file_path) -> bool:
+    """删除临时文件，返回是否删除成功。"""
+    try:
+        os.unlink(file_path)
+        return True
+    except OSError as exc:
+        logger.warning(f"清理临时文件失败 {file_path}: {exc}")
+        return False
+
+
+@contextmanager
+def _task_dedup_lock(owner, *key_parts):
+    """
+    以缓存锁对相同参数的备份任务去重
+
+    重试或重复提交触发同一备份时，只有首个获得锁的任务执行，
+    其余直接返回；缓存不可用时不阻塞备份。
+
+    Args:
+        owner: 锁持有者标识（Celery 任务 ID）
+        key_parts: 用于生成锁键的任务参数
+
+    Yields:
+        bool: 是否获得锁
+    """
+    digest = hashlib.sha1(json.dumps(key_parts, default=str).encode()).hexdigest()
+    lock_key = f"backup:lock:{digest}"
+    owner = owner or digest
+    try:
+        acquired = cache.add(
+            lock_key, owner, timeout=getattr(settings, 'BACKUP_TASK_LOCK_TIMEOUT', 3600)
+        )
+    except Exception as exc:
+        logger.warning(f"获取备份任务锁失败，继续执行: {exc}")
+        yield True
+        return
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            try:
+                # 只释放自己持有的锁，超时后被他人获取的锁保持不动。
+                if cache.get(lock_key) == owner:
+                    cache.delete(lock_key)
+            except Exception as exc:
+                logger.warning(f"释放备份任务锁失败: {exc}")
+
+
+def _delete_records_in_batches(record_ids, batch_size=500) -> int:
+    """
+    按主键分批删除备份记录，避免逐条 DELETE 与过长的 IN 列表
+
+    BackupRecord 没有删除信号，指向它的外键（一次性任务的 backup_record、
+    增量备份的 base_backup）均为 SET_NULL：逐个关系先批量置空再 _raw_delete，
+    跳过 Collector 逐行加载记录。出现其他 on_delete 行为的关系时退回 delete()。
+    """
+    relations = BackupRecord._meta.related_objects
+    raw_deletable = all(rel.on_delete is models.SET_NULL for rel in relations)
+    for start in range(0, len(record_ids), batch_size):
+        batch = record_ids[start:start + batch_size]
+        queryset = BackupRecord.objects.filter(pk__in=batch)
+        if not raw_deletable:
+            queryset.delete()
+            continue
+        with transaction.atomic(using=queryset.db):
+            for rel in relations:
+                rel.related_model._base_manager.filter(
+                    **{f'{rel.field.attname}__in': batch}
+                ).update(**{rel.field.name: None})
+            queryset._raw_delete(queryset.db)
+    return len(record_ids)
+
+
+def _parallel_map(func, items) -> list:
+    """在清理线程池中并发执行 func，并按输入顺序返回结果。"""
+    max_workers = max(1, getattr(settings, 'BACKUP_CLEANUP_PARALLEL', 16))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, items))
+
+
 def _execute_backup_core(
     strategy_id=None,
     instance_id=None,
@@ -28,14 +194,24 @@ def _execute_backup_core(
     remote_storage_path=None,
     remote_config_override=None,
     oss_config_override=None,
-    storage_mode=None
+    storage_mode=None,
+    started_at=None,
+    remote_password_ciphertext=None
 ):
-    from apps.backups.models import BackupStrategy, BackupRecord
-    from apps.instances.models import MySQLInstance, PasswordEncryptor
-    from apps.backups.services import BackupExecutor
+    """
+    备份核心流程：解析配置、创建记录、执行备份并回写结果
+
+    remote_config/oss_config 中保存的是已解密的凭据，在此处解密一次，
+    所有库的备份与上传共用，执行器不再从模型重新解密。
+    remote_password_ciphertext 为来源中已保存的远程密码密文，成功记录直接复制。
 
-    # 保留 backup_record 句柄，失败时可更新状态。
-    backup_record = None
+    started_at 为任务开始时间（一次性任务传入其 started_at，保持两条记录一致），
+    未提供时在入口取一次。
+
+    Returns:
+        tuple: (BackupRecord, 结果字典)
+    """
+    started_at = started_at or timezone.now()
 
     # 1. 解析策略/实例配置并规范化入参。
     remote_config = remote_config_override
@@ -64,6 +240,7 @@ def _execute_backup_core(
                 'password': strategy.get_decrypted_remote_password(),
                 'key_path': strategy.remote_key_path,
             }
+            remote_password_ciphertext = strategy.remote_password
         if store_oss:
             # 对象存储凭据为加密存储，运行时解密使用。
             oss_config = {
@@ -89,26 +266,13 @@ def _execute_backup_core(
         raise ValueError("必须提供 strategy_id 或 instance_id")
 
     # 规范化存储模式：每次执行只保留一个目标。
-    if storage_mode == 'default':
-        store_local = True
-        store_remote = False
-        store_oss = False
-    elif storage_mode == 'mysql_host':
-        store_local = False
-        store_remote = True
-        store_oss = False
-    elif storage_mode == 'remote_server':
-        store_local = False
-        store_remote = True
-        store_oss = False
-        if not remote_config:
-            raise ValueError("远程服务器配置缺失，无法上传备份")
-    elif storage_mode == 'oss':
-        store_local = False
-        store_remote = False
-        store_oss = True
-        if not oss_config:
-            raise ValueError("云存储配置缺失，无法上传备份")
+    flags = STORAGE_MODE_FLAGS.get(storage_mode)
+    if flags:
+        store_local, store_remote, store_oss = flags
+    if storage_mode == 'remote_server' and not remote_config:
+        raise ValueError("远程服务器配置缺失，无法上传备份")
+    if storage_mode == 'oss' and not oss_config:
+        raise ValueError("云存储配置缺失，无法上传备份")
 
     base_backup = None
     if backup_type == 'incremental':
@@ -121,57 +285,24 @@ def _execute_backup_core(
         if not base_backup:
             raise Exception("增量备份需要先有成功的热备/增量备份作为基准")
 
-    # 2. 创建运行中的记录用于审计与进度跟踪。
-    encrypted_remote_password = ''
-    if remote_config and remote_config.get('password'):
-        encrypted_remote_password = PasswordEncryptor.encrypt(remote_config.get('password'))
-
+    # 2. 创建运行中的记录用于审计与进度跟踪（仅写必要列，远程连接信息随成功状态一并写入）。
     backup_record = BackupRecord.objects.create(
         instance=instance,
         strategy=strategy,
         database_name=database_name or '',
         backup_type=backup_type,
         status='running',
-        start_time=timezone.now(),
+        start_time=started_at,
         created_by_id=user_id,
-        base_backup=base_backup,
-        remote_path='',
-        object_storage_path='',
-        remote_protocol=remote_config.get('protocol') if remote_config else '',
-        remote_host=remote_config.get('host') if remote_config else '',
-        remote_port=remote_config.get('port') if remote_config else None,
-        remote_user=remote_config.get('user') if remote_config else '',
-        remote_password=encrypted_remote_password,
-        remote_key_path=remote_config.get('key_path') if remote_config else ''
+        base_backup=base_backup
     )
 
     logger.info(f"开始备份任务: 记录ID={backup_record.id}, 实例={instance.alias}")
 
-    # 3. 根据类型执行逻辑/物理备份。
-    executor = BackupExecutor(instance)
-
-    # 如果指定多个数据库，逐个执行备份。
-    if databases and len(databases) > 0:
-        for db in databases:
-            result = executor.execute_backup(
-                database_name=db,
-                compress=compress,
-                storage_path=storage_path,
-                backup_type=backup_type,
-                base_backup=base_backup,
-                store_local=store_local,
-                store_remote=store_remote,
-                store_oss=store_oss,
-                remote_storage_path=remote_storage_path,
-                remote_config=remote_config,
-                oss_config=oss_config
-            )
-
-            if not result['success']:
-                raise Exception(f"数据库 {db} 备份失败: {result.get('error_message')}")
-    else:
-        # 备份全部数据库（执行器内部过滤系统库）。
-        result = executor.execute_backup(
+    try:
+        result = _run_backup_executor(
+            instance,
+            databases=databases,
             database_name=database_name,
             compress=compress,
             storage_path=storage_path,
@@ -182,26 +313,39 @@ def _execute_backup_core(
             store_oss=store_oss,
             remote_storage_path=remote_storage_path,
             remote_config=remote_config,
-            oss_config=oss_config
+            oss_config=oss_config,
+            compression_algo=strategy.compression_algo if strategy else None
         )
+    except Exception as exc:
+        # 失败时仅更新状态相关列，便于追踪。
+        BackupRecord.objects.filter(pk=backup_record.pk).update(
+            status='failed',
+            end_time=timezone.now(),
+            error_message=str(exc)
+        )
+        raise
 
-        if not result['success']:
-            raise Exception(result.get('error_message'))
-
-    # 4. 标记成功并保存产物信息。
-    backup_record.status = 'success'
-    backup_record.end_time = timezone.now()
-    backup_record.file_path = result['file_path']
-    backup_record.file_size_mb = result['file_size_mb']
-    backup_record.remote_path = result.get('remote_path', '')
-    backup_record.object_storage_path = result.get('object_storage_path', '')
-    backup_record.save()
+    # 4. 标记成功并保存产物信息（单条 UPDATE，仅写变更列）。
+    BackupRecord.objects.filter(pk=backup_record.pk).update(
+        status='success',
+        end_time=timezone.now(),
+        file_path=result['file_path'],
+        file_size_mb=result['file_size_mb'],
+        sha256=result.get('sha256', ''),
+        remote_path=result.get('remote_path', ''),
+        object_storage_path=result.get('object_storage_path', ''),
+        **_remote_record_fields(remote_config, remote_password_ciphertext)
+    )
 
     logger.info(f"备份任务完成: 记录ID={backup_record.id}")
 
-    # 5. 根据策略配置触发保留清理。
+    # 5. 根据策略配置触发保留清理（事务提交后再投递，未处于事务时立即投递）。
     if strategy and strategy.retention_days:
-        cleanup_old_backups.delay(instance_id=instance.id, days=strategy.retention_days)
+        transaction.on_commit(
+            lambda iid=instance.id, days=strategy.retention_days: cleanup_old_backups.delay(
+                instance_id=iid, days=days
+            )
+        )
 
     return backup_record, {
         'success': True,
@@ -213,6 +357,93 @@ def _execute_backup_core(
     }
 
 
+def _remote_record_fields(remote_config, encrypted_password=None):
+    """
+    生成备份记录中的远程连接字段
+
+    只在备份成功后写入：失败的记录不会用于下载/恢复，无需加密保存凭据。
+
+    Args:
+        remote_config: 远程连接配置
+        encrypted_password: 来源（策略/一次性任务）中已保存的密码密文，提供时直接复制，
+            不再重新加密；手动执行没有来源密文时才加密 remote_config 中的明文
+    """
+    if not remote_config:
+        return {}
+    password = remote_config.get('password')
+    if not password:
+        encrypted_password = ''
+    elif not encrypted_password:
+        encrypted_password = PasswordEncryptor.encrypt(password)
+    return {
+        'remote_protocol': remote_config.get('protocol') or '',
+        'remote_host': remote_config.get('host') or '',
+        'remote_port': remote_config.get('port'),
+        'remote_user': remote_config.get('user') or '',
+        'remote_password': encrypted_password,
+        'remote_key_path': remote_config.get('key_path') or '',
+    }
+
+
+def _run_backup_executor(
+    instance,
+    databases,
+    database_name,
+    compress,
+    storage_path,
+    backup_type,
+    base_backup,
+    store_local,
+    store_remote,
+    store_oss,
+    remote_storage_path,
+    remote_config,
+    oss_config,
+    compression_algo=None
+):
+    """按库或整实例执行备份，任一失败即抛出异常。"""
+    # 3. 根据类型执行逻辑/物理备份；执行器在各库间复用远程连接，结束时关闭。
+    with BackupExecutor(instance) as executor:
+        backup_kwargs = {
+            'compress': compress,
+            'storage_path': storage_path,
+            'backup_type': backup_type,
+            'base_backup': base_backup,
+            'store_local': store_local,
+            'store_remote': store_remote,
+            'store_oss': store_oss,
+            'remote_storage_path': remote_storage_path,
+            'remote_config': remote_config,
+            'oss_config': oss_config,
+            'compression_algo': compression_algo,
+        }
+
+        # 多库时并发执行：各库的 dump/压缩/上传互不依赖，且主要耗在等待 I/O。
+        if databases and len(databases) > 1:
+            max_workers = max(1, min(len(databases), getattr(settings, 'BACKUP_DATABASE_PARALLEL', 4)))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(
+                    lambda db: executor.execute_backup(database_name=db, **backup_kwargs),
+                    databases
+                ))
+            for db, result in zip(databases, results):
+                if not result['success']:
+                    raise Exception(f"数据库 {db} 备份失败: {result.get('error_message')}")
+            return results[-1]
+
+        if databases:
+            result = executor.execute_backup(database_name=databases[0], **backup_kwargs)
+            if not result['success']:
+                raise Exception(f"数据库 {databases[0]} 备份失败: {result.get('error_message')}")
+        else:
+            # 备份全部数据库（执行器内部过滤系统库）。
+            result = executor.execute_backup(database_name=database_name, **backup_kwargs)
+            if not result['success']:
+                raise Exception(result.get('error_message'))
+
+        return result
+
+
 @shared_task(bind=True, max_retries=3)
 def execute_backup_task(self, strategy_id=None, instance_id=None,
                         database_name=None, user_id=None, backup_type=None,
@@ -230,115 +461,128 @@ def execute_backup_task(self, strategy_id=None, instance_id=None,
     Returns:
         dict: 备份结果
     """
-    backup_record = None
-    
-    try:
-        # 使用核心执行器处理策略/实例参数。
-        backup_record, result = _execute_backup_core(
-            strategy_id=strategy_id,
-            instance_id=instance_id,
-            database_name=database_name,
-            user_id=user_id,
-            backup_type=backup_type,
-            compress=compress
-        )
-        return result
-        
-    except Exception as e:
-        error_msg = str(e)
-        logger.exception(f"备份任务失败: {error_msg}")
+    with _task_dedup_lock(self.request.id, 'backup', strategy_id, instance_id,
+                          database_name, backup_type) as acquired:
+        if not acquired:
+            logger.info(f"相同备份任务正在执行，跳过: strategy={strategy_id}, instance={instance_id}")
+            return {'success': True, 'deduped': True}
+
+        try:
+            # 使用核心执行器处理策略/实例参数（失败状态由其写回记录）。
+            _, result = _execute_backup_core(
+                strategy_id=strategy_id,
+                instance_id=instance_id,
+                database_name=database_name,
+                user_id=user_id,
+                backup_type=backup_type,
+                compress=compress
+            )
+            return result
         
-        # 失败时更新记录，便于追踪。
-        if backup_record:
-            backup_record.status = 'failed'
-            backup_record.end_time = timezone.now()
-            backup_record.error_message = error_msg
-            backup_record.save()
+        except Exception as e:
+            error_msg = str(e)
+            logger.exception(f"备份任务失败: {error_msg}")
         
-        # 使用退避重试处理临时故障。
-        if self.request.retries < self.max_retries:
-            raise self.retry(exc=e, countdown=60 * (self.request.retries + 1))
+            # 使用退避重试处理临时故障。
+            if self.request.retries < self.max_retries:
+                raise self.retry(exc=e, countdown=60 * (self.request.retries + 1))
         
-        return {
-            'success': False,
-            'error_message': error_msg
-        }
+            return {
+                'success': False,
+                'error_message': error_msg
+            }
 
 
 @shared_task(bind=True, max_retries=3)
 def execute_oneoff_backup_task(self, task_id):
-    from apps.backups.models import BackupOneOffTask
+    with _task_dedup_lock(self.request.id, 'oneoff', task_id) as acquired:
+        if not acquired:
+            logger.info(f"一次性备份任务正在执行，跳过: {task_id}")
+            return {'success': True, 'deduped': True}
 
-    # 加载一次性任务信息并标记为运行中。
-    task = BackupOneOffTask.objects.select_related('instance').filter(id=task_id).first()
-    if not task:
-        return {'success': False, 'error_message': '定时任务不存在'}
+        # 加载一次性任务信息并标记为运行中。
+        # 核心流程按 instance_id 自行加载实例，这里无需关联查询；只取执行用到的列
+        # （含解密所需的密文列），跳过 error_message 等无关大字段。
+        task = BackupOneOffTask.objects.filter(id=task_id).only(
+            'id', 'instance_id', 'databases', 'backup_type', 'compress',
+            'storage_path', 'storage_mode', 'store_local', 'store_remote', 'store_oss',
+            'remote_storage_path', 'remote_protocol', 'remote_host', 'remote_port',
+            'remote_user', 'remote_password', 'remote_key_path',
+            'oss_endpoint', 'oss_access_key_id', 'oss_access_key_secret',
+            'oss_bucket', 'oss_prefix', 'created_by_id'
+        ).first()
+        if not task:
+            return {'success': False, 'error_message': '定时任务不存在'}
 
-    task.status = 'running'
-    task.started_at = timezone.now()
-    task.save(update_fields=['status', 'started_at'])
+        started_at = timezone.now()
+        BackupOneOffTask.objects.filter(pk=task.pk).update(
+            status='running',
+            started_at=started_at
+        )
 
-    backup_record = None
-    try:
-        # 根据任务配置构建远程/OSS 参数。
-        remote_config_override = None
-        oss_config_override = None
-        if task.store_remote and task.storage_mode == 'remote_server':
-            remote_config_override = {
-                'protocol': task.remote_protocol,
-                'host': task.remote_host,
-                'port': task.remote_port,
-                'user': task.remote_user,
-                'password': task.get_decrypted_remote_password(),
-                'key_path': task.remote_key_path,
-            }
-        if task.store_oss:
-            oss_config_override = {
-                'endpoint': task.oss_endpoint,
-                'access_key_id': task.oss_access_key_id,
-                'access_key_secret': task.get_decrypted_oss_access_key_secret(),
-                'bucket': task.oss_bucket,
-                'prefix': task.oss_prefix,
-            }
+        try:
+            # 根据任务配置构建远程/OSS 参数。
+            remote_config_override = None
+            oss_config_override = None
+            if task.store_remote and task.storage_mode == 'remote_server':
+                remote_config_override = {
+                    'protocol': task.remote_protocol,
+                    'host': task.remote_host,
+                    'port': task.remote_port,
+                    'user': task.remote_user,
+                    'password': task.get_decrypted_remote_password(),
+                    'key_path': task.remote_key_path,
+                }
+            if task.store_oss:
+                oss_config_override = {
+                    'endpoint': task.oss_endpoint,
+                    'access_key_id': task.oss_access_key_id,
+                    'access_key_secret': task.get_decrypted_oss_access_key_secret(),
+                    'bucket': task.oss_bucket,
+                    'prefix': task.oss_prefix,
+                }
 
-        # 执行核心备份流程。
-        backup_record, result = _execute_backup_core(
-            instance_id=task.instance_id,
-            databases=task.databases or None,
-            user_id=task.created_by_id,
-            backup_type=task.backup_type,
-            compress=task.compress,
-            storage_path=task.storage_path or None,
-            store_local=task.store_local,
-            store_remote=task.store_remote,
-            store_oss=task.store_oss,
-            remote_storage_path=task.remote_storage_path or None,
-            remote_config_override=remote_config_override,
-            oss_config_override=oss_config_override,
-            storage_mode=task.storage_mode
-        )
-        task.status = 'success'
-        task.finished_at = timezone.now()
-        task.backup_record = backup_record
-        task.error_message = ''
-        task.save(update_fields=['status', 'finished_at', 'backup_record', 'error_message'])
-        return result
-    except Exception as exc:
-        # 持久化失败状态，便于审计。
-        error_msg = str(exc)
-        task.status = 'failed'
-        task.finished_at = timezone.now()
-        task.error_message = error_msg
-        if backup_record:
-            task.backup_record = backup_record
-        task.save(update_fields=['status', 'finished_at', 'backup_record', 'error_message'])
-        logger.exception(f"定时备份任务失败: {error_msg}")
-        if self.request.retries < self.max_retries:
-            raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
-        return {'success': False, 'error_message': error_msg}
+            # 执行核心备份流程。
+            backup_record, result = _execute_backup_core(
+                instance_id=task.instance_id,
+                databases=task.databases or None,
+                user_id=task.created_by_id,
+                backup_type=task.backup_type,
+                compress=task.compress,
+                storage_path=task.storage_path or None,
+                store_local=task.store_local,
+                store_remote=task.store_remote,
+                store_oss=task.store_oss,
+                remote_storage_path=task.remote_storage_path or None,
+                remote_config_override=remote_config_override,
+                oss_config_override=oss_config_override,
+                storage_mode=task.storage_mode,
+                started_at=started_at,
+                remote_password_ciphertext=task.remote_password
+            )
+            BackupOneOffTask.objects.filter(pk=task.pk).update(
+                status='success',
+                finished_at=timezone.now(),
+                backup_record=backup_record,
+                error_message=''
+            )
+            return result
+        except Exception as exc:
+            # 持久化失败状态，便于审计。
+            error_msg = str(exc)
+            BackupOneOffTask.objects.filter(pk=task.pk).update(
+                status='failed',
+                finished_at=timezone.now(),
+                error_message=error_msg
+            )
+            logger.exception(f"定时备份任务失败: {error_msg}")
+            if self.request.retries < self.max_retries:
+                raise self.retry(exc=exc, countdown=60 * (self.request.retries + 1))
+            return {'success': False, 'error_message': error_msg}
 
-@shared_task
-def cleanup_old_backups(instance_id=None, days=None):
+
+@shared_task(**DB_RETRY_OPTIONS)
+def cleanup_old_backups(self, instance_id=None, days=None):
     """
     清理过期备份文件
     
@@ -349,9 +593,6 @@ def cleanup_old_backups(instance_id=None, days=None):
     Returns:
         dict: 清理结果
     """
-    from apps.backups.models import BackupRecord
-    from apps.instances.models import MySQLInstance
-    
     try:
         # 计算保留策略的截止时间。
         if days is None:
@@ -368,27 +609,24 @@ def cleanup_old_backups(instance_id=None, days=None):
         if instance_id:
             query = query.filter(instance_id=instance_id)
         
-        # 先删除文件，再删除记录。
-        expired_records = query.all()
+        # 只取用到的列并分块读取，不实例化模型。
+        deleted_ids = []
+        file_paths = []
+        file_sizes_mb = []
+        rows = query.values_list('id', 'file_path', 'file_size_mb').iterator(chunk_size=500)
+        for record_id, file_path, file_size_mb in rows:
+            deleted_ids.append(record_id)
+            if file_path:
+                file_paths.append(file_path)
+                file_sizes_mb.append(file_size_mb)
         
-        deleted_count = 0
-        freed_space_mb = 0
+        # 先删除记录并提交：删除失败重试时文件仍在，不会留下指向已删文件的记录。
+        with transaction.atomic():
+            deleted_count = _delete_records_in_batches(deleted_ids)
         
-        for record in expired_records:
-            # 如果本地文件存在则删除。
-            if record.file_path and os.path.exists(record.file_path):
-                try:
-                    file_path = Path(record.file_path)
-                    file_size = file_path.stat().st_size / (1024 * 1024)
-                    file_path.unlink()
-                    freed_space_mb += file_size
-                    logger.info(f"删除过期备份文件: {record.file_path}")
-                except Exception as e:
-                    logger.error(f"删除文件失败 {record.file_path}: {str(e)}")
-            
-            # 删除记录，保持元数据一致。
-            record.delete()
-            deleted_count += 1
+        # 并发删除本地文件（删除为 I/O 等待型操作）；
+        # 释放空间取记录中的 file_size_mb，仅在缺失时 stat 文件。
+        freed_space_mb = _unlink_backup_files(file_paths, file_sizes_mb)
         
         logger.info(f"清理完成: 删除 {deleted_count} 个备份，释放 {freed_space_mb:.2f} MB")
         
@@ -398,6 +636,9 @@ def cleanup_old_backups(instance_id=None, days=None):
             'freed_space_mb': round(freed_space_mb, 2)
         }
         
+    except DatabaseError:
+        # 交由 Celery 自动重试。
+        raise
     except Exception as e:
         error_msg = str(e)
         logger.exception(f"清理任务失败: {error_msg}")
@@ -407,8 +648,8 @@ def cleanup_old_backups(instance_id=None, days=None):
         }
 
 
-@shared_task
-def cleanup_temp_backups(hours=None):
+@shared_task(name='backups.cleanup_temp_backups', **DB_RETRY_OPTIONS)
+def cleanup_temp_backups(self, hours=None):
     """
     清理下载/上传产生的临时备份文件
 
@@ -418,32 +659,30 @@ def cleanup_temp_backups(hours=None):
     try:
         # 清理下载/上传流程产生的临时文件。
         if hours is None:
-            hours = getattr(settings, 'BACKUP_TEMP_RETENTION_HOURS', 24)
-        cutoff_time = timezone.now() - timedelta(hours=hours)
-
-        backup_root = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
-        temp_dirs = [backup_root / 'tmp', backup_root / 'uploads']
+            hours = _DEFAULT_TEMP_HOURS
+        cutoff_ts = (timezone.now() - timedelta(hours=hours)).timestamp()
 
-        deleted = 0
-        freed_mb = 0.0
-
-        for temp_dir in temp_dirs:
-            if not temp_dir.exists() or not temp_dir.is_dir():
+        # 先扫描出过期文件（scandir 复用目录项，每个文件只 stat 一次）。
+        expired = []
+        for temp_dir in _TEMP_DIRS:
+            if not temp_dir.is_dir():
                 continue
-            for file_path in temp_dir.iterdir():
-                try:
-                    if not file_path.is_file():
-                        continue
-                    mtime = timezone.make_aware(
-                        timezone.datetime.fromtimestamp(file_path.stat().st_mtime)
-                    )
-                    if mtime < cutoff_time:
-                        size_mb = file_path.stat().st_size / (1024 * 1024)
-                        file_path.unlink()
-                        deleted += 1
-                        freed_mb += size_mb
-                except Exception as exc:
-                    logger.warning(f"清理临时文件失败 {file_path}: {exc}")
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    try:
+                        # 不跟随符号链接，避免误删临时目录之外的文件。
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        stat = entry.stat()
+                        if stat.st_mtime < cutoff_ts:
+                            expired.append((entry.path, stat.st_size / (1024 * 1024)))
+                    except OSError as exc:
+                        logger.warning(f"清理临时文件失败 {entry.path}: {exc}")
+
+        # 再并发删除，与过期备份清理共用线程池配置。
+        results = _parallel_map(_unlink_temp_file, [path for path, _ in expired])
+        deleted = sum(results)
+        freed_mb = sum(size_mb for (_, size_mb), ok in zip(expired, results) if ok)
 
         logger.info(f"临时文件清理完成: 删除 {deleted} 个，释放 {freed_mb:.2f} MB")
         return {
@@ -451,6 +690,9 @@ def cleanup_temp_backups(hours=None):
             'deleted_count': deleted,
             'freed_space_mb': round(freed_mb, 2)
         }
+    except DatabaseError:
+        # 交由 Celery 自动重试。
+        raise
     except Exception as exc:
         error_msg = str(exc)
         logger.exception(f"临时文件清理失败: {error_msg}")
@@ -460,8 +702,106 @@ def cleanup_temp_backups(hours=None):
         }
 
 
-@shared_task
-def verify_backup_integrity(backup_id):
+def _inspect_backup_file(file_path, inflate_head=False):
+    """
+    打开一次备份文件，完成存在性、大小、可读性与压缩头部检查
+
+    默认只校验文件头（gzip 魔数 + deflate 方法 / zstd 魔数），不初始化解压器；
+    没有全文件校验和可比对时，由 inflate_head 要求额外解压头部 64KB。
+
+    Returns:
+        tuple: (是否有效, 失败原因, 文件大小 MB)
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return False, '备份文件不存在', 0.0
+    except OSError as e:
+        return False, f'文件不可读: {str(e)}', 0.0
+
+    try:
+        # 2) File size sanity check.
+        actual_size = os.fstat(fd).st_size / (1024 * 1024)
+        if actual_size < 0.01:  # 小于10KB认为异常
+            return False, f'备份文件过小: {actual_size:.2f} MB', actual_size
+
+        # 3) 读取文件头，同时验证可读性。
+        try:
+            head = os.pread(fd, 65536 if inflate_head else 10, 0)
+        except OSError as e:
+            return False, f'文件不可读: {str(e)}', actual_size
+    finally:
+        os.close(fd)
+
+    # 4) For gz/zst files, validate the header and optionally inflate the head.
+    suffix = Path(file_path).suffix
+    if suffix == '.gz':
+        if len(head) < 10 or not head.startswith(GZIP_MAGIC) or head[2] != 8:
+            return False, '压缩文件损坏: gzip 文件头无效', actual_size
+        if inflate_head:
+            try:
+                zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(head, 1 << 20)
+            except zlib.error as e:
+                return False, f'压缩文件损坏: {str(e)}', actual_size
+    elif suffix == '.zst':
+        if not head.startswith(ZSTD_MAGIC):
+            return False, '压缩文件损坏: zstd 文件头无效', actual_size
+        if inflate_head and zstandard is not None:
+            try:
+                zstandard.ZstdDecompressor().decompressobj().decompress(head)
+            except zstandard.ZstdError as e:
+                return False, f'压缩文件损坏: {str(e)}', actual_size
+
+    return True, '', actual_size
+
+
+def _verify_backup_file(file_path, expected_sha256=''):
+    """
+    校验单个备份文件（头部检查 + 全文件校验和比对）
+
+    记录中保存了 SHA-256 时重新计算并比对；旧记录没有 SHA-256 时解压头部做抽检。
+
+    Args:
+        file_path: 备份文件路径
+        expected_sha256: 备份记录中保存的 SHA-256
+
+    Returns:
+        dict: 验证结果，结构与 verify_backup_integrity 一致
+    """
+    file_path = Path(file_path)
+
+    # 1)-4) 存在性、大小、可读性与 gzip 头部检查共用一次 open/pread；
+    # 后续有全文件校验和时无需再解压头部。
+    is_valid, message, actual_size = _inspect_backup_file(file_path, inflate_head=not expected_sha256)
+    if not is_valid:
+        return {
+            'success': False,
+            'is_valid': False,
+            'message': message
+        }
+    
+    # 5) Re-hash and compare against the SHA-256 stored on the record.
+    if expected_sha256:
+        actual_sha256 = compute_file_sha256(file_path)
+        if actual_sha256 != expected_sha256:
+            return {
+                'success': False,
+                'is_valid': False,
+                'message': f'备份文件 SHA-256 不匹配: 期望 {expected_sha256}, 实际 {actual_sha256}'
+            }
+
+    logger.info(f"备份文件验证成功: {file_path}")
+    
+    return {
+        'success': True,
+        'is_valid': True,
+        'message': '备份文件完整',
+        'file_size_mb': round(actual_size, 2)
+    }
+
+
+@shared_task(**DB_RETRY_OPTIONS)
+def verify_backup_integrity(self, backup_id):
     """
     验证备份文件完整性
     
@@ -471,9 +811,6 @@ def verify_backup_integrity(backup_id):
     Returns:
         dict: 验证结果
     """
-    from apps.backups.models import BackupRecord
-    import gzip
-    
     try:
         # 获取备份记录并校验磁盘文件。
         backup_record = BackupRecord.objects.get(id=backup_id)
@@ -485,58 +822,7 @@ def verify_backup_integrity(backup_id):
                 'message': '备份文件路径为空'
             }
         
-        file_path = Path(backup_record.file_path)
-        
-        # 1) File existence check.
-        if not file_path.exists():
-            return {
-                'success': False,
-                'is_valid': False,
-                'message': '备份文件不存在'
-            }
-        
-        # 2) File size sanity check.
-        actual_size = file_path.stat().st_size / (1024 * 1024)
-        if actual_size < 0.01:  # 小于10KB认为异常
-            return {
-                'success': False,
-                'is_valid': False,
-                'message': f'备份文件过小: {actual_size:.2f} MB'
-            }
-        
-        # 3) For gz files, try to read the header to validate gzip integrity.
-        if file_path.suffix == '.gz':
-            try:
-                with gzip.open(file_path, 'rb') as f:
-                    # 读取前1KB检查是否可以解压
-                    f.read(1024)
-            except Exception as e:
-                return {
-                    'success': False,
-                    'is_valid': False,
-                    'message': f'压缩文件损坏: {str(e)}'
-                }
-        
-        # 4) Check file readability.
-        try:
-            with open(file_path, 'rb') as f:
-                # 读取前1KB检查是否可读
-                f.read(1024)
-        except Exception as e:
-            return {
-                'success': False,
-                'is_valid': False,
-                'message': f'文件不可读: {str(e)}'
-            }
-        
-        logger.info(f"备份文件验证成功: {file_path}")
-        
-        return {
-            'success': True,
-            'is_valid': True,
-            'message': '备份文件完整',
-            'file_size_mb': round(actual_size, 2)
-        }
+        return _verify_backup_file(backup_record.file_path, backup_record.sha256)
         
     except BackupRecord.DoesNotExist:
         return {
@@ -544,6 +830,9 @@ def verify_backup_integrity(backup_id):
             'is_valid': False,
             'message': '备份记录不存在'
         }
+    except DatabaseError:
+        # 交由 Celery 自动重试。
+        raise
     except Exception as e:
         error_msg = str(e)
         logger.exception(f"验证任务失败: {error_msg}")
@@ -553,8 +842,59 @@ def verify_backup_integrity(backup_id):
         }
 
 
-@shared_task
-def check_backup_limits(instance_id):
+@shared_task(**DB_RETRY_OPTIONS)
+def verify_backup_integrity_bulk(self, backup_ids):
+    """
+    批量验证备份文件完整性
+
+    一次查询取出全部记录，再用线程池并发校验文件，重叠各文件的磁盘等待。
+
+    Args:
+        backup_ids: 备份记录 ID 列表
+
+    Returns:
+        dict: {备份记录 ID: 验证结果}
+    """
+    try:
+        records = list(
+            BackupRecord.objects.filter(id__in=backup_ids).values_list('id', 'file_path', 'sha256')
+        )
+        found = {record[0] for record in records}
+
+        def verify(record):
+            backup_id, file_path, sha256 = record
+            if not file_path:
+                return backup_id, {
+                    'success': False,
+                    'is_valid': False,
+                    'message': '备份文件路径为空'
+                }
+            return backup_id, _verify_backup_file(file_path, sha256)
+
+        results = dict(_parallel_map(verify, records))
+        for backup_id in backup_ids:
+            if backup_id not in found:
+                results[backup_id] = {
+                    'success': False,
+                    'is_valid': False,
+                    'message': '备份记录不存在'
+                }
+        return results
+
+    except DatabaseError:
+        # 交由 Celery 自动重试。
+        raise
+    except Exception as e:
+        error_msg = str(e)
+        logger.exception(f"批量验证任务失败: {error_msg}")
+        return {
+            'success': False,
+            'error_message': error_msg
+        }
+
+
+@shared_task(**DB_RETRY_OPTIONS)
+def check_backup_limits(self, instance_id):
     """
     检查实例的备份数量限制，删除超出的备份
     
@@ -564,9 +904,6 @@ def check_backup_limits(instance_id):
     Returns:
         dict: 检查结果
     """
-    from apps.backups.models import BackupRecord
-    from django.conf import settings
-    
     try:
         max_files = getattr(settings, 'BACKUP_MAX_FILES_PER_INSTANCE', 50)
         
@@ -576,24 +913,21 @@ def check_backup_limits(instance_id):
             status='success'
         ).order_by('-created_at')
         
-        # 超限时优先删除最旧的备份。
-        if backups.count() > max_files:
-            excess_backups = backups[max_files:]
-            deleted_count = 0
-            
-            for backup in excess_backups:
-                # 删除本地文件（如存在）。
-                if backup.file_path and os.path.exists(backup.file_path):
-                    try:
-                        Path(backup.file_path).unlink()
-                        logger.info(f"删除超限备份文件: {backup.file_path}")
-                    except Exception as e:
-                        logger.error(f"删除文件失败: {str(e)}")
-                
-                # 删除记录，保持元数据一致。
-                backup.delete()
-                deleted_count += 1
-            
+        # 超限时优先删除最旧的备份：每轮 OFFSET 查询只读取上限之后的一块（仅 id 与路径），
+        # 删除后下一轮同一偏移处即为剩余的超限记录，内存占用以块大小为界。
+        deleted_count = 0
+        while True:
+            chunk = list(backups.values_list('id', 'file_path')[max_files:max_files + 500])
+            if not chunk:
+                break
+            # 先删除本块记录并提交，再删除本地文件（如存在）。
+            with transaction.atomic():
+                deleted_count += _delete_records_in_batches(
+                    [backup_id for backup_id, _ in chunk]
+                )
+            _unlink_backup_files([file_path for _, file_path in chunk if file_path])
+        
+        if deleted_count:
             logger.info(f"实例 {instance_id} 清理超限备份: {deleted_count} 个")
             
             return {
@@ -608,6 +942,9 @@ def check_backup_limits(instance_id):
             'current_count': backups.count()
         }
         
+    except DatabaseError:
+        # 交由 Celery 自动重试。
+        raise
     except Exception as e:
         error_msg = str(e)
         logger.exception(f"检查备份限制失败: {error_msg}")
@@ -615,3 +952,143 @@ def check_backup_limits(instance_id):
             'success': False,
             'error_message': error_msg
         }
+
+
+# 合并策略启停触发的调度同步，窗口内只排队一次。
+BEAT_SYNC_PENDING_KEY = 'backup:beat_sync:pending'
+
+
+def schedule_beat_sync():
+    """
+    延迟触发一次 Celery Beat 同步
+
+    在事务提交后才占用待执行标记并投递，事务回滚时不留下标记；
+    短时间内的多次启停合并为一次同步，已有待执行的同步时直接复用。
+    消息代理不可用时清除标记并退回为同步执行，保证调度不会漏同步。
+    """
+    delay = getattr(settings, 'BACKUP_BEAT_SYNC_DELAY', 1)
+
+    def dispatch():
+        try:
+            queued = cache.add(BEAT_SYNC_PENDING_KEY, 1, timeout=delay + 60)
+        except Exception as exc:
+            logger.warning(f"获取调度同步标记失败，直接投递: {exc}")
+            queued = True
+        if not queued:
+            return
+        try:
+            sync_celery_beat_task.apply_async(countdown=delay)
+        except Exception as exc:
+            logger.warning(f"投递调度同步任务失败，改为同步执行: {exc}")
+            try:
+                cache.delete(BEAT_SYNC_PENDING_KEY)
+            except Exception as cache_exc:
+                logger.warning(f"清除调度同步标记失败: {cache_exc}")
+            StrategyManager.sync_to_celery_beat()
+
+    transaction.on_commit(dispatch)
+
+
+@shared_task(**DB_RETRY_OPTIONS)
+def sync_celery_beat_task(self):
+    """
+    同步启用的备份策略到 Celery Beat
+
+    先清除待执行标记，使同步开始后的新变更能再次排队。
+    """
+    try:
+        cache.delete(BEAT_SYNC_PENDING_KEY)
+    except Exception as exc:
+        logger.warning(f"清除调度同步标记失败: {exc}")
+    return StrategyManager.sync_to_celery_beat()
+
+
+def schedule_backup_file_delete(file_path, size_mb=None):
+    """
+    在事务提交后投递本地备份文件的删除任务
+
+    消息代理不可用时退回为同步删除，保证文件不会遗留。
+
+    Args:
+        file_path: 备份文件路径
+        size_mb: 记录中已保存的文件大小（MB），删除时可跳过 stat
+    """
+    if not file_path:
+        return
+
+    def dispatch():
+        try:
+            delete_backup_file.delay(file_path, size_mb)
+        except Exception as exc:
+            logger.warning(f"投递备份文件删除任务失败，改为同步删除: {exc}")
+            _safe_unlink(file_path, size_mb)
+
+    transaction.on_commit(dispatch)
+
+
+@shared_task
+def delete_backup_file(file_path, size_mb=None):
+    """
+    删除单个本地备份文件
+
+    由删除接口异步触发，避免请求线程等待慢速存储上的 unlink。
+    """
+    return {'success': True, 'freed_space_mb': _safe_unlink(file_path, size_mb)}
+
+
+def purge_backup_records(queryset) -> int:
+    """
+    批量删除备份记录，并在事务提交后异步删除其本地文件
+
+    Args:
+        queryset: 待删除的 BackupRecord 查询集
+
+    Returns:
+        int: 删除的记录数
+    """
+    record_ids = []
+    file_paths = []
+    file_sizes_mb = []
+    rows = queryset.values_list('id', 'file_path', 'file_size_mb').iterator(chunk_size=500)
+    for record_id, file_path, file_size_mb in rows:
+        record_ids.append(record_id)
+        if file_path:
+            file_paths.append(file_path)
+            file_sizes_mb.append(file_size_mb)
+
+    deleted_count = _delete_records_in_batches(record_ids)
+    schedule_backup_files_delete(file_paths, file_sizes_mb)
+    return deleted_count
+
+
+def schedule_backup_files_delete(file_paths, sizes_mb=None):
+    """
+    在事务提交后投递一批本地备份文件的删除任务
+
+    消息代理不可用时退回为同步删除，保证文件不会遗留。
+
+    Args:
+        file_paths: 备份文件路径列表
+        sizes_mb: 与 file_paths 对应的已知大小（MB）
+    """
+    if not file_paths:
+        return
+
+    def dispatch():
+        try:
+            delete_backup_files.delay(file_paths, sizes_mb)
+        except Exception as exc:
+            logger.warning(f"投递备份文件批量删除任务失败，改为同步删除: {exc}")
+            _unlink_backup_files(file_paths, sizes_mb)
+
+    transaction.on_commit(dispatch)
+
+
+@shared_task
+def delete_backup_files(file_paths, sizes_mb=None):
+    """
+    并发删除一批本地备份文件
+
+    由批量删除记录的操作异步触发。
+    """
+    return {'success': True, 'freed_space_mb': round(_unlink_backup_files(file_paths, sizes_mb), 2)}
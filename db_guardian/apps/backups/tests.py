@@ -1,3 +1,120 @@
-from django.test import TestCase
+import io
+import subprocess
+import sys
+import time
+from unittest import mock
 
-# 在此编写测试用例。
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.authentication.models import Team, User
+from apps.backups.models import BackupRecord
+from apps.backups.services import RestoreExecutor, StrategyManager
+from apps.backups.tasks import BEAT_SYNC_PENDING_KEY, schedule_beat_sync, sync_celery_beat_task
+from apps.instances.models import MySQLInstance
+
+
+class RestoreStreamTimeoutTests(SimpleTestCase):
+    """流式恢复在 mysql 不读取 stdin 时仍按超时终止"""
+
+    def setUp(self):
+        self.executor = RestoreExecutor(MySQLInstance(id=1, alias='db-a', password=''))
+        # 模拟卡在锁等待的 mysql：从不读取 stdin，管道写满后写入方会阻塞。
+        self.stalled_argv = [sys.executable, '-c', 'import time; time.sleep(60)']
+
+    def test_pipe_to_mysql_kills_stalled_process(self):
+        reader = io.BytesIO(b'x' * (8 * 1024 * 1024))
+        started = time.monotonic()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            with mock.patch.object(RestoreExecutor, '_build_mysql_env', return_value={}):
+                self.executor._pipe_to_mysql(self.stalled_argv, reader, subprocess.DEVNULL, 1, 64 * 1024)
+        self.assertLess(time.monotonic() - started, 30)
+
+    def test_execute_restore_stream_reports_timeout(self):
+        with mock.patch.object(RestoreExecutor, '_build_mysql_command', return_value=self.stalled_argv):
+            result = self.executor.execute_restore_stream(
+                io.BytesIO(b'x' * (8 * 1024 * 1024)), timeout=1, chunk_size=64 * 1024
+            )
+        self.assertFalse(result['success'])
+        self.assertTrue(result['error_message'].startswith('恢复超时'))
+
+
+class BackupRecordCursorPaginationTests(TestCase):
+    """备份记录列表按非默认排序逐页翻页"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        team = Team.objects.create(name='team-a', owner=cls.admin)
+        instance = MySQLInstance.objects.create(
+            alias='db-a', host='10.0.0.1', port=3306, username='root',
+            password='pw', team=team, created_by=cls.admin
+        )
+        # 文件大小有重复值、开始时间部分为空，覆盖并列值与空值两种情况。
+        sizes = [3.0, 1.0, 1.0, 2.0, 1.0]
+        cls.record_ids = [
+            BackupRecord.objects.create(
+                instance=instance,
+                backup_type='full',
+                status='success',
+                file_size_mb=size,
+                start_time=None if i % 2 else timezone.now()
+            ).id
+            for i, size in enumerate(sizes)
+        ]
+
+    def _page_through(self, ordering):
+        client = APIClient(SERVER_NAME='localhost')
+        client.force_authenticate(self.admin)
+        url = f'/api/backups/records/?ordering={ordering}&page_size=2'
+        seen = []
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200, response.content)
+            seen.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+        return seen
+
+    def test_pages_through_non_default_orderings(self):
+        for ordering in ('file_size_mb', '-file_size_mb', 'created_at', 'start_time', '-start_time'):
+            with self.subTest(ordering=ordering):
+                seen = self._page_through(ordering)
+                self.assertEqual(len(seen), len(set(seen)))
+                self.assertCountEqual(seen, self.record_ids)
+
+    def test_file_size_ordering_is_stable_across_pages(self):
+        records = BackupRecord.objects.filter(id__in=self.record_ids)
+        expected = list(records.order_by('file_size_mb', 'id').values_list('id', flat=True))
+        self.assertEqual(self._page_through('file_size_mb'), expected)
+
+
+class ScheduleBeatSyncTests(TestCase):
+    """调度同步在提交后投递，投递失败时清除标记并同步执行"""
+
+    def setUp(self):
+        cache.delete(BEAT_SYNC_PENDING_KEY)
+        self.addCleanup(cache.delete, BEAT_SYNC_PENDING_KEY)
+
+    def test_broker_error_clears_flag_and_syncs_inline(self):
+        with mock.patch.object(sync_celery_beat_task, 'apply_async', side_effect=OSError('broker down')), \
+                mock.patch.object(StrategyManager, 'sync_to_celery_beat') as sync:
+            with self.captureOnCommitCallbacks(execute=True):
+                schedule_beat_sync()
+            sync.assert_called_once_with()
+        self.assertIsNone(cache.get(BEAT_SYNC_PENDING_KEY))
+
+    def test_rollback_leaves_no_flag(self):
+        with mock.patch.object(sync_celery_beat_task, 'apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=False):
+                schedule_beat_sync()
+            apply_async.assert_not_called()
+        self.assertIsNone(cache.get(BEAT_SYNC_PENDING_KEY))
+
+    def test_syncs_within_window_are_coalesced(self):
+        with mock.patch.object(sync_celery_beat_task, 'apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                schedule_beat_sync()
+                schedule_beat_sync()
+            apply_async.assert_called_once()
@@ -5,7 +5,9 @@
 """
 from django.utils import timezone
 from django.http import FileResponse
-from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from django.db.models import Prefetch
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.authentication import SessionAuthentication
@@ -13,13 +15,15 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.pagination import CursorPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from pathlib import Path
 import logging
-from uuid import uuid4
+import os
 
 from apps.backups.models import BackupStrategy, BackupRecord, BackupOneOffTask
+from apps.backups.filters import BackupRecordFilter
 from apps.backups.serializers import (
     BackupStrategySerializer,
     BackupStrategyCreateSerializer,
@@ -28,166 +32,89 @@ from apps.backups.serializers import (
     ManualBackupSerializer,
     RestoreSerializer,
     RestoreUploadSerializer,
+    VerifyBulkSerializer,
     BackupOneOffTaskSerializer,
     BackupOneOffTaskCreateSerializer,
 )
 from apps.backups.services import (
     StrategyManager,
     RestoreExecutor,
-    RemoteExecutor,
-    RemoteStorageClient,
-    ObjectStorageUploader
+    build_sendfile_response,
+    is_temp_download,
+    prepare_backup_download_path,
 )
-from apps.backups.tasks import execute_backup_task, verify_backup_integrity
+from apps.backups.tasks import (
+    execute_backup_task, execute_oneoff_backup_task, schedule_backup_file_delete,
+    schedule_beat_sync, verify_backup_integrity, verify_backup_integrity_bulk
+)
+from apps.authentication.models import Team
 from apps.authentication.permissions import IsTeamMember, IsTeamAdmin
+from common.renderers import ORJSONRenderer
 from apps.instances.models import MySQLInstance
 
 logger = logging.getLogger(__name__)
 
 
-def _infer_backup_filenames(record):
-    # 汇总所有存储位置的可能文件名，提高命中率。
-    names = []
-    for path_value in [record.file_path, record.remote_path, record.object_storage_path]:
-        if not path_value:
-            continue
-        if path_value.startswith('oss://'):
-            stripped = path_value[len('oss://'):]
-            _, _, key = stripped.partition('/')
-            if key:
-                name = Path(key).name
-                if name not in ('', '.', '..'):
-                    names.append(name)
-                    continue
-        name = Path(path_value).name
-        if name not in ('', '.', '..'):
-            names.append(name)
-
-    unique = []
-    for name in names:
-        if name not in unique:
-            unique.append(name)
-    if unique:
-        return unique
-
-    # 回退为根据记录元数据生成文件名。
-    timestamp = None
-    if record.start_time:
-        timestamp = record.start_time.strftime('%Y%m%d_%H%M%S')
-    elif record.created_at:
-        timestamp = record.created_at.strftime('%Y%m%d_%H%M%S')
-
-    db_suffix = record.database_name or 'all'
-    alias = record.instance.alias if record.instance else 'backup'
-    candidates = []
-    if timestamp:
-        base = f"{alias}_{db_suffix}_{timestamp}.sql"
-        if record.strategy and not record.strategy.compress:
-            candidates.append(base)
-            candidates.append(base + '.gz')
-        else:
-            candidates.append(base + '.gz')
-            candidates.append(base)
-    candidates.append(f"backup_{record.id}.sql.gz")
-    candidates.append(f"backup_{record.id}.sql")
-
-    unique = []
-    for name in candidates:
-        if name not in unique:
-            unique.append(name)
-    return unique
-
-
-def _prepare_backup_download_path(record):
-    # 先尝试本地文件，再尝试远程存储，最后尝试对象存储。
-    filenames = _infer_backup_filenames(record)
-
-    if record.file_path:
-        file_path = Path(record.file_path)
-        if file_path.exists() and file_path.is_file():
-            return file_path
-        if file_path.exists() and file_path.is_dir():
-            for name in filenames:
-                candidate = file_path / name
-                if candidate.exists() and candidate.is_file():
-                    return candidate
-
-    backup_root = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
-    temp_dir = backup_root / 'tmp'
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    temp_path = None
-    if filenames:
-        temp_path = temp_dir / filenames[0]
-
-    if record.remote_path:
-        try:
-            remote_candidates = []
-            remote_path = record.remote_path
-            if Path(remote_path).suffix:
-                remote_candidates.append(remote_path)
-            else:
-                for name in filenames:
-                    remote_candidates.append(str(Path(remote_path) / name))
-
-            for remote_candidate in remote_candidates:
-                # 将远程候选文件下载到临时目录。
-                temp_path = temp_dir / Path(remote_candidate).name
-                if record.remote_protocol:
-                    client = RemoteStorageClient(
-                        protocol=record.remote_protocol,
-                        host=record.remote_host,
-                        port=record.remote_port,
-                        user=record.remote_user,
-                        password=record.get_decrypted_remote_password(),
-                        key_path=record.remote_key_path
-                    )
-                    client.download(remote_candidate, temp_path)
-                else:
-                    executor = RemoteExecutor(record.instance)
-                    executor.download(remote_candidate, temp_path)
-                if temp_path.exists() and temp_path.is_file():
-                    return temp_path
-        except Exception as exc:
-            logger.warning(f"远程备份下载失败: {exc}")
-
-    if record.object_storage_path:
-        oss_config = None
-        if record.strategy and (
-            record.strategy.oss_endpoint
-            or record.strategy.oss_access_key_id
-            or record.strategy.oss_bucket
-        ):
-            # 如策略配置了 OSS 信息，优先使用策略级别配置。
-            oss_config = {
-                'endpoint': record.strategy.oss_endpoint,
-                'access_key_id': record.strategy.oss_access_key_id,
-                'access_key_secret': record.strategy.get_decrypted_oss_access_key_secret(),
-                'bucket': record.strategy.oss_bucket,
-                'prefix': record.strategy.oss_prefix
-            }
-        uploader = ObjectStorageUploader(config=oss_config)
-        try:
-            object_path = record.object_storage_path
-            object_candidates = []
-            if object_path.endswith('/'):
-                for name in filenames:
-                    object_candidates.append(object_path.rstrip('/') + '/' + name)
-            else:
-                object_candidates.append(object_path)
-
-            for object_candidate in object_candidates:
-                # 下载对象存储候选文件到临时目录以便响应/恢复。
-                temp_path = temp_dir / Path(object_candidate).name
-                uploader.download(object_candidate, temp_path)
-                if temp_path.exists() and temp_path.is_file():
-                    return temp_path
-        except Exception as exc:
-            logger.warning(f"OSS 备份下载失败: {exc}")
+def _backup_validators(record, file_path=None):
+    """
+    生成备份下载的 ETag 与 Last-Modified 时间戳
 
-    return None
+    有 SHA-256 时仅凭记录即可得出强 ETag，无需先取回远程/OSS 文件；
+    否则使用记录 ID、文件大小与修改时间，需传入已就绪的 file_path。
+    备份完成后内容不再变化，Last-Modified 优先取记录完成时间。
 
+    Returns:
+        tuple | None: (etag, last_modified)；无法得出（未传文件或文件已被清理）时为 None
+    """
+    finished_at = record.end_time or record.created_at
+    if record.sha256 and finished_at:
+        return f'"{record.sha256}"', int(finished_at.timestamp())
+    if file_path is None:
+        return None
+    try:
+        file_stat = os.stat(file_path)
+    except OSError as exc:
+        logger.warning(f"读取备份文件属性失败 {file_path}: {exc}")
+        return None
+    if record.sha256:
+        etag = f'"{record.sha256}"'
+    else:
+        etag = f'"{record.id}-{file_stat.st_size}-{int(file_stat.st_mtime)}"'
+    last_modified = int(finished_at.timestamp()) if finished_at else int(file_stat.st_mtime)
+    return etag, last_modified
+
+
+def _instance_team_prefetch() -> Prefetch:
+    """实例所属团队单独 IN 查询，只取序列化用到的 id/name，不再拼进主查询每一行。"""
+    return Prefetch('instance__team', queryset=Team.objects.only('id', 'name'))
+
+
+class CachedObjectMixin:
+    """
+    单个对象查询结果在本次请求内复用
 
-class BackupStrategyViewSet(viewsets.ModelViewSet):
+    ViewSet 实例按请求创建，同一请求内重复调用 get_object() 时
+    不再重新执行查询与对象权限检查。
+    """
+
+    def get_object(self):
+        lookup = (self.action, self.kwargs.get(self.lookup_url_kwarg or self.lookup_field))
+        cached = getattr(self, '_cached_object', None)
+        if cached is not None and cached[0] == lookup:
+            return cached[1]
+        obj = super().get_object()
+        self._cached_object = (lookup, obj)
+        return obj
+
+
+# 策略列表不返回的密文列（含 select_related 的实例凭据）。
+STRATEGY_LIST_DEFERRED_COLUMNS = (
+    'remote_password', 'oss_access_key_secret',
+    'instance__password', 'instance__ssh_password', 'created_by__password',
+)
+
+
+class BackupStrategyViewSet(CachedObjectMixin, viewsets.ModelViewSet):
     """
     备份策略管理 ViewSet
     
@@ -199,6 +126,7 @@ class BackupStrategyViewSet(viewsets.ModelViewSet):
     """
     
     permission_classes = [IsAuthenticated, IsTeamMember]
+    renderer_classes = [ORJSONRenderer]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['instance', 'is_enabled', 'backup_type']
     search_fields = ['name']
@@ -213,19 +141,20 @@ class BackupStrategyViewSet(viewsets.ModelViewSet):
         - 普通用户：仅查看所属团队的策略
         """
         user = self.request.user
+        if self.action == 'list':
+            # 列表不渲染密文字段，跳过策略与关联实例的加密凭据列。
+            queryset = BackupStrategy.objects.select_related(
+                'instance', 'created_by'
+            ).prefetch_related(_instance_team_prefetch()).defer(*STRATEGY_LIST_DEFERRED_COLUMNS)
+        else:
+            # 单对象操作直接连接团队表，一次查询取齐权限检查与序列化所需数据。
+            queryset = BackupStrategy.objects.select_related('instance__team', 'created_by')
         
         if user.is_superuser:
-            return BackupStrategy.objects.all().select_related(
-                'instance', 'instance__team', 'created_by'
-            )
+            return queryset
         
-        # 获取用户所属的所有团队
-        user_teams = user.teams.all()
-        return BackupStrategy.objects.filter(
-            instance__team__in=user_teams
-        ).select_related(
-            'instance', 'instance__team', 'created_by'
-        )
+        # 按用户所属团队过滤
+        return queryset.filter(instance__team_id__in=user.get_team_ids())
     
     def get_serializer_class(self):
         """根据动作返回不同的序列化器"""
@@ -255,12 +184,16 @@ class BackupStrategyViewSet(viewsets.ModelViewSet):
                 'message': '策略已经是启用状态'
             }, status=status.HTTP_400_BAD_REQUEST)
         
+        # 单条 UPDATE 写两列，不回读也不触发 save() 逻辑。
+        BackupStrategy.objects.filter(pk=strategy.pk).update(
+            is_enabled=True, updated_at=timezone.now()
+        )
+        
         strategy.is_enabled = True
-        strategy.save()
         
-        # 同步到 Celery Beat
+        # 只同步该策略的调度任务，耗时与策略总数无关。
         try:
-            StrategyManager.sync_to_celery_beat()
+            StrategyManager.sync_one(strategy)
             return Response({
                 'success': True,
                 'message': '策略已启用并同步到调度器'
@@ -287,15 +220,18 @@ class BackupStrategyViewSet(viewsets.ModelViewSet):
                 'message': '策略已经是禁用状态'
             }, status=status.HTTP_400_BAD_REQUEST)
         
+        BackupStrategy.objects.filter(pk=strategy.pk).update(
+            is_enabled=False, updated_at=timezone.now()
+        )
+        
         strategy.is_enabled = False
-        strategy.save()
         
-        # 同步到 Celery Beat（删除定时任务）
+        # 只停用该策略的调度任务，耗时与策略总数无关。
         try:
-            StrategyManager.sync_to_celery_beat()
+            StrategyManager.sync_one(strategy)
             return Response({
                 'success': True,
-                'message': '策略已禁用并从调度器中移除'
+                'message': '策略已禁用并从调度器中停用'
             })
         except Exception as e:
             logger.exception(f"Failed to sync strategy: {str(e)}")
@@ -312,12 +248,12 @@ class BackupStrategyViewSet(viewsets.ModelViewSet):
         POST /strategies/sync/
         """
         try:
-            result = StrategyManager.sync_to_celery_beat()
+            schedule_beat_sync()
             return Response({
                 'success': True,
-                'message': '策略同步成功',
-                'result': result
-            })
+                'message': '策略同步已排队',
+                'pending': True
+            }, status=status.HTTP_202_ACCEPTED)
         except Exception as e:
             logger.exception(f"Failed to sync strategies: {str(e)}")
             return Response({
@@ -326,7 +262,36 @@ class BackupStrategyViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class BackupRecordViewSet(viewsets.ModelViewSet):
+# BackupRecordListSerializer 用到的列（含关联的实例别名与策略名称）。
+BACKUP_RECORD_LIST_COLUMNS = (
+    'id', 'instance__alias', 'strategy__name', 'database_name', 'backup_type',
+    'base_backup', 'status', 'file_size_mb', 'start_time', 'end_time',
+    'created_at', 'remote_path', 'object_storage_path',
+)
+
+
+class BackupRecordCursorPagination(CursorPagination):
+    """
+    备份记录游标分页
+
+    按 (created_at, id) 倒序定位下一页，翻页代价与页码无关，也不再执行 COUNT(*)。
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        # ?ordering= 指定的排序追加同方向的 id 作为并列值的稳定次序，游标偏移才能准确跳过同值记录。
+        if ordering[-1].lstrip('-') not in ('id', 'pk'):
+            direction = '-' if ordering[0].startswith('-') else ''
+            ordering += (f'{direction}id',)
+        return ordering
+
+
+class BackupRecordViewSet(CachedObjectMixin, viewsets.ModelViewSet):
     """
     备份记录管理 ViewSet
     
@@ -340,11 +305,14 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
     
     permission_classes = [IsAuthenticated, IsTeamMember]
     authentication_classes = [JWTAuthentication, SessionAuthentication]
+    renderer_classes = [ORJSONRenderer]
+    pagination_class = BackupRecordCursorPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['instance', 'status', 'backup_type']
+    filterset_class = BackupRecordFilter
     search_fields = ['database_name']
-    ordering_fields = ['created_at', 'start_time', 'file_size_mb']
-    ordering = ['-created_at']
+    # 游标分页以首个排序列定位，只开放非空列（start_time 可为空，无法编码为游标）。
+    ordering_fields = ['created_at', 'file_size_mb']
+    ordering = ['-created_at', '-id']
     
     def get_queryset(self):
         """
@@ -354,19 +322,19 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
         - 普通用户：仅查看所属团队的记录
         """
         user = self.request.user
+        queryset = BackupRecord.objects.all()
         
-        if user.is_superuser:
-            return BackupRecord.objects.all().select_related(
-                'instance', 'instance__team', 'strategy', 'created_by'
-            )
+        if not user.is_superuser:
+            # 按用户所属团队过滤
+            queryset = queryset.filter(instance__team_id__in=user.get_team_ids())
         
-        # 获取用户所属的所有团队
-        user_teams = user.teams.all()
-        return BackupRecord.objects.filter(
-            instance__team__in=user_teams
-        ).select_related(
-            'instance', 'instance__team', 'strategy', 'created_by'
-        )
+        if self.action == 'list':
+            # 列表只读取序列化所需的列，跳过密文、错误信息等大字段。
+            return queryset.select_related('instance', 'strategy').only(
+                *BACKUP_RECORD_LIST_COLUMNS
+            )
+        # 单对象操作直接连接团队表，一次查询取齐权限检查与序列化所需数据。
+        return queryset.select_related('instance__team', 'strategy', 'created_by')
     
     def get_serializer_class(self):
         """根据动作返回不同的序列化器"""
@@ -388,19 +356,14 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
         DELETE /records/{id}/
         """
         record = self.get_object()
-        
-        # 删除文件
-        if record.file_path and Path(record.file_path).exists():
-            try:
-                # 仅删除本地文件；远程/对象存储由其他流程处理。
-                Path(record.file_path).unlink()
-                logger.info(f"已删除备份文件: {record.file_path}")
-            except Exception as e:
-                logger.error(f"删除备份文件失败: {str(e)}")
+        file_path, size_mb = record.file_path, record.file_size_mb
         
         # 删除记录
         record.delete()
         
+        # 记录删除提交后异步删除本地文件；远程/对象存储由其他流程处理。
+        schedule_backup_file_delete(file_path, size_mb)
+        
         return Response({
             'success': True,
             'message': '备份记录已删除'
@@ -421,21 +384,51 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
                 'message': '只能下载成功的备份文件'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        file_path = _prepare_backup_download_path(record)
+        # 条件 GET：记录有 SHA-256 时在取回远程/OSS 文件之前判断，
+        # 客户端已持有相同备份时直接返回 304。
+        validators = _backup_validators(record)
+        if validators is not None:
+            not_modified = get_conditional_response(
+                request, etag=validators[0], last_modified=validators[1]
+            )
+            if not_modified is not None:
+                return not_modified
+        
+        file_path = prepare_backup_download_path(record)
+        if file_path and validators is None:
+            # 无 SHA-256 的旧记录只能按文件属性生成校验值；文件已被清理时视为不存在。
+            validators = _backup_validators(record, file_path)
+            if validators is None:
+                file_path = None
+            else:
+                not_modified = get_conditional_response(
+                    request, etag=validators[0], last_modified=validators[1]
+                )
+                if not_modified is not None:
+                    return not_modified
         if not file_path:
             return Response({
                 'success': False,
                 'message': '备份文件不存在或无法下载'
             }, status=status.HTTP_404_NOT_FOUND)
+        etag, last_modified = validators
+        
+        # 本地备份根目录下的文件交由 nginx/Apache 以 sendfile 发送。
+        response = build_sendfile_response(file_path)
         
         # 返回文件
         try:
-            # 以流方式返回，避免一次性读入内存。
-            response = FileResponse(
-                open(file_path, 'rb'),
-                as_attachment=True,
-                filename=file_path.name
-            )
+            if response is None:
+                # 以流方式返回，避免一次性读入内存；按 1MB 分块读取以减少 read 调用
+                # （FileResponse 会根据文件大小设置 Content-Length）。
+                response = FileResponse(
+                    open(file_path, 'rb', buffering=0),
+                    as_attachment=True,
+                    filename=file_path.name
+                )
+                response.block_size = 1024 * 1024
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
             return response
         except Exception as e:
             logger.exception(f"Failed to download backup: {str(e)}")
@@ -475,7 +468,7 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
         
         target_database = serializer.validated_data.get('target_database')
         
-        restore_path = _prepare_backup_download_path(record)
+        restore_path = prepare_backup_download_path(record)
         if not restore_path:
             return Response({
                 'success': False,
@@ -510,13 +503,9 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         finally:
             try:
-                # 如果是临时下载文件则清理。
-                if restore_path and (
-                    not record.file_path
-                    or Path(record.file_path).resolve() != restore_path.resolve()
-                ):
-                    if restore_path.exists():
-                        restore_path.unlink()
+                # 远程/OSS 下载到临时目录的文件才清理，按路径前缀判断，无需 resolve。
+                if is_temp_download(restore_path):
+                    restore_path.unlink(missing_ok=True)
             except Exception as exc:
                 logger.warning(f"清理临时恢复文件失败: {exc}")
 
@@ -557,20 +546,13 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
                     'message': '无权限恢复该实例'
                 }, status=status.HTTP_403_FORBIDDEN)
 
-        backup_root = Path(getattr(settings, 'BACKUP_STORAGE_PATH', settings.BASE_DIR / 'backups'))
-        temp_dir = backup_root / 'uploads'
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        safe_name = Path(backup_file.name).name
-        temp_path = temp_dir / f"restore_{uuid4().hex}_{safe_name}"
+        suffix = Path(backup_file.name).suffix
+        compression = suffix if suffix in ('.gz', '.zst') else None
 
         try:
-            with open(temp_path, 'wb') as f_out:
-                # 分块写入，避免占用过多内存。
-                for chunk in backup_file.chunks():
-                    f_out.write(chunk)
-
+            # 上传内容直接流入 mysql（Django 已落盘的大文件以其描述符作 stdin），不再另存副本。
             executor = RestoreExecutor(instance)
-            result = executor.execute_restore(str(temp_path), target_database)
+            result = executor.execute_restore_stream(backup_file, target_database, compression)
             if result.get('success'):
                 return Response({
                     'success': True,
@@ -587,13 +569,6 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
                 'success': False,
                 'message': f'恢复失败: {str(exc)}'
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        finally:
-            try:
-                # 始终清理上传的临时文件。
-                if temp_path.exists():
-                    temp_path.unlink()
-            except Exception as exc:
-                logger.warning(f"清理上传文件失败: {exc}")
     
     @action(detail=True, methods=['post'], url_path='verify')
     def verify(self, request, pk=None):
@@ -619,8 +594,45 @@ class BackupRecordViewSet(viewsets.ModelViewSet):
             'task_id': task.id
         })
 
+    @action(detail=False, methods=['post'], url_path='verify-bulk')
+    def verify_bulk(self, request):
+        """
+        批量验证备份文件完整性
+        
+        POST /records/verify-bulk/
+        Body: {"ids": [1, 2, 3]}
+        """
+        serializer = VerifyBulkSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({
+                'success': False,
+                'message': '请提供要验证的备份记录 ID 列表',
+                'errors': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+        ids = serializer.validated_data['ids']
+        
+        # 仅验证当前用户可见且成功的备份。
+        backup_ids = list(
+            self.get_queryset().filter(id__in=ids, status='success').values_list('id', flat=True)
+        )
+        if not backup_ids:
+            return Response({
+                'success': False,
+                'message': '没有可验证的备份文件'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # 单个任务内批量校验，避免每条记录各派发一个任务。
+        task = verify_backup_integrity_bulk.delay(backup_ids)
+        
+        return Response({
+            'success': True,
+            'message': '验证任务已创建',
+            'task_id': task.id,
+            'backup_ids': backup_ids
+        })
 
-class BackupOneOffTaskViewSet(viewsets.ModelViewSet):
+
+class BackupOneOffTaskViewSet(CachedObjectMixin, viewsets.ModelViewSet):
     """
     一次性定时任务 ViewSet
     """
@@ -636,9 +648,8 @@ class BackupOneOffTaskViewSet(viewsets.ModelViewSet):
         user = self.request.user
         if user.is_superuser:
             return BackupOneOffTask.objects.all().select_related('instance', 'created_by', 'backup_record')
-        user_teams = user.teams.all()
         return BackupOneOffTask.objects.filter(
-            instance__team__in=user_teams
+            instance__team_id__in=user.get_team_ids()
         ).select_related('instance', 'created_by', 'backup_record')
 
     def get_serializer_class(self):
@@ -655,7 +666,6 @@ class BackupOneOffTaskViewSet(viewsets.ModelViewSet):
         task = serializer.save(created_by=self.request.user)
         # 使用 ETA 调度
         try:
-            execute_oneoff_backup_task = __import__('apps.backups.tasks', fromlist=['execute_oneoff_backup_task']).execute_oneoff_backup_task
             # 按计划时间调度一次性任务。
             async_result = execute_oneoff_backup_task.apply_async((task.id,), eta=task.run_at)
             task.task_id = async_result.id
@@ -667,7 +677,6 @@ class BackupOneOffTaskViewSet(viewsets.ModelViewSet):
     def run_now(self, request, pk=None):
         task = self.get_object()
         try:
-            execute_oneoff_backup_task = __import__('apps.backups.tasks', fromlist=['execute_oneoff_backup_task']).execute_oneoff_backup_task
             # 忽略计划时间立即触发。
             async_result = execute_oneoff_backup_task.delay(task.id)
             task.task_id = async_result.id
@@ -682,8 +691,12 @@ class BackupOneOffTaskViewSet(viewsets.ModelViewSet):
         task = self.get_object()
         if task.status not in ['pending', 'running']:
             return Response({'success': False, 'message': '任务状态不可取消'}, status=status.HTTP_400_BAD_REQUEST)
-        task.status = 'canceled'
-        task.save(update_fields=['status'])
+        # 带状态条件的 UPDATE，任务在此期间已结束时不覆盖其状态。
+        updated = BackupOneOffTask.objects.filter(
+            pk=task.pk, status__in=['pending', 'running']
+        ).update(status='canceled')
+        if not updated:
+            return Response({'success': False, 'message': '任务状态不可取消'}, status=status.HTTP_400_BAD_REQUEST)
         return Response({'success': True, 'message': '任务已取消'})
 
 
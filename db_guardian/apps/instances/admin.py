@@ -9,13 +9,28 @@ from django.utils.html import format_html
 from django.urls import reverse, path
 from django.utils.safestring import mark_safe
 from django.http import HttpResponseRedirect, JsonResponse
-from django.db.models import OuterRef, Subquery
+from django.db.models import Count, OuterRef, Subquery
 from django.template.response import TemplateResponse
 from django.shortcuts import get_object_or_404
 from apps.instances.models import MySQLInstance, Database, MonitoringMetrics
 from apps.instances.services import DatabaseSyncService
 from apps.backups.tasks import execute_backup_task
 
+# 徽章在导入时预渲染，列表逐行直接查表，不再调用 format_html。
+_STATUS_COLORS = {
+    'online': 'green',
+    'offline': 'orange',
+    'error': 'red',
+}
+_STATUS_BADGES = {
+    value: format_html('<span style="color: {};">● {}</span>', _STATUS_COLORS.get(value, 'gray'), label)
+    for value, label in MySQLInstance.STATUS_CHOICES
+}
+_USAGE_BADGE_TEMPLATES = {
+    color: f'<span style="color: {color};">%.1f%%</span>'
+    for color in ('green', 'orange', 'red')
+}
+
 
 @admin.register(MySQLInstance)
 class MySQLInstanceAdmin(admin.ModelAdmin):
@@ -107,24 +122,28 @@ class MySQLInstanceAdmin(admin.ModelAdmin):
     
     def status_badge(self, obj):
         """状态徽章"""
-        colors = {
-            'online': 'green',
-            'offline': 'orange',
-            'error': 'red',
-        }
-        return format_html(
-            '<span style="color: {};">● {}</span>',
-            colors.get(obj.status, 'gray'),
-            obj.get_status_display()
-        )
+        badge = _STATUS_BADGES.get(obj.status)
+        if badge is None:
+            badge = format_html('<span style="color: gray;">● {}</span>', obj.get_status_display())
+        return badge
     status_badge.short_description = '状态'
     
+    def get_queryset(self, request):
+        # 列表页一次性关联团队/创建人并聚合数据库数量，避免逐行查询。
+        return super().get_queryset(request).select_related(
+            'team', 'created_by'
+        ).annotate(_db_count=Count('databases'))
+
     def database_count(self, obj):
         """数据库数量"""
-        count = obj.databases.count()
+        count = getattr(obj, '_db_count', None)
+        if count is None:
+            count = obj.databases.count()
         url = reverse('admin:instances_database_changelist') + f'?instance__id__exact={obj.id}'
-        return format_html('<a href="{}">{} 个</a>', url, count)
+        # url 与 count 均为程序生成的整数拼接，无需逐行转义。
+        return mark_safe(f'<a href="{url}">{int(count)} 个</a>')
     database_count.short_description = '数据库数量'
+    database_count.admin_order_field = '_db_count'
     
     def password_info(self, obj):
         """密码信息（不显示明文）"""
@@ -380,7 +399,6 @@ class MonitoringMetricsAdmin(admin.ModelAdmin):
         'connections', 'slow_queries',
         'cpu_usage', 'memory_usage', 'disk_usage'
     ]
-    date_hierarchy = 'timestamp'
     change_list_template = 'admin/instances/monitoringmetrics/change_list.html'
     
     def has_add_permission(self, request):
@@ -405,16 +423,35 @@ class MonitoringMetricsAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
-    def changelist_view(self, request, extra_context=None):
-        latest = MonitoringMetrics.objects.filter(
+    @staticmethod
+    def _instances_with_latest_metrics():
+        """
+        实例列表附带最新一条监控指标
+
+        每个实例只用一个相关子查询（走 (instance, -timestamp) 索引）取最新指标 ID，
+        再按 ID 一次取回指标行，替代逐列的四个相关子查询。
+        """
+        latest_id = MonitoringMetrics.objects.filter(
             instance=OuterRef('pk')
-        ).order_by('-timestamp')
-        instances = MySQLInstance.objects.annotate(
-            last_timestamp=Subquery(latest.values('timestamp')[:1]),
-            last_cpu=Subquery(latest.values('cpu_usage')[:1]),
-            last_memory=Subquery(latest.values('memory_usage')[:1]),
-            last_disk=Subquery(latest.values('disk_usage')[:1])
-        ).order_by('alias')
+        ).order_by('-timestamp').values('id')[:1]
+        instances = list(
+            MySQLInstance.objects.only('id', 'alias').annotate(
+                latest_metric_id=Subquery(latest_id)
+            ).order_by('alias')
+        )
+        metrics = MonitoringMetrics.objects.only(
+            'id', 'timestamp', 'cpu_usage', 'memory_usage', 'disk_usage'
+        ).in_bulk([inst.latest_metric_id for inst in instances if inst.latest_metric_id])
+        for inst in instances:
+            metric = metrics.get(inst.latest_metric_id)
+            inst.last_timestamp = metric.timestamp if metric else None
+            inst.last_cpu = metric.cpu_usage if metric else None
+            inst.last_memory = metric.memory_usage if metric else None
+            inst.last_disk = metric.disk_usage if metric else None
+        return instances
+
+    def changelist_view(self, request, extra_context=None):
+        instances = self._instances_with_latest_metrics()
         context = {
             **self.admin_site.each_context(request),
             'title': '监控指标',
@@ -426,15 +463,7 @@ class MonitoringMetricsAdmin(admin.ModelAdmin):
         return TemplateResponse(request, self.change_list_template, context)
 
     def realtime_view(self, request):
-        latest = MonitoringMetrics.objects.filter(
-            instance=OuterRef('pk')
-        ).order_by('-timestamp')
-        instances = MySQLInstance.objects.annotate(
-            last_timestamp=Subquery(latest.values('timestamp')[:1]),
-            last_cpu=Subquery(latest.values('cpu_usage')[:1]),
-            last_memory=Subquery(latest.values('memory_usage')[:1]),
-            last_disk=Subquery(latest.values('disk_usage')[:1])
-        ).order_by('alias')
+        instances = self._instances_with_latest_metrics()
         data = []
         for inst in instances:
             data.append({
@@ -476,11 +505,8 @@ class MonitoringMetricsAdmin(admin.ModelAdmin):
         else:
             color = 'green'
         
-        value_display = f"{numeric:.1f}%"
-        return format_html(
-            '<span style="color: {};">{}</span>',
-            color, value_display
-        )
+        # 数值与颜色均为受控输入，直接套用预生成模板。
+        return mark_safe(_USAGE_BADGE_TEMPLATES[color] % numeric)
 
 
 # 自定义 Admin 站点标题
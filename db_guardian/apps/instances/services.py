@@ -13,6 +13,7 @@ from django.utils import timezone
 import pymysql
 from pymysql.cursors import DictCursor
 from apps.backups.services import RemoteExecutor
+from apps.instances.models import Database, MonitoringMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -377,8 +378,6 @@ class MetricsCollector:
             bool: 是否保存成功
         """
         try:
-            from apps.instances.models import MonitoringMetrics
-            
             MonitoringMetrics.objects.create(
                 instance=instance,
                 qps=metrics.get('qps', 0),
@@ -490,8 +489,6 @@ class DatabaseSyncService:
             schemas = cursor.fetchall()
         connection.close()
 
-        from apps.instances.models import Database
-
         created_count = 0
         updated_count = 0
         deleted_count = 0
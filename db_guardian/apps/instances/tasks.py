@@ -5,7 +5,7 @@ MySQL 实例管理的 Celery 定时任务
 """
 from celery import shared_task
 from django.utils import timezone
-from apps.instances.models import MySQLInstance
+from apps.instances.models import Database, MonitoringMetrics, MySQLInstance
 from apps.instances.services import HealthChecker, MetricsCollector
 import logging
 
@@ -149,7 +149,6 @@ def cleanup_old_metrics(days=30):
     - 删除超过指定天数的监控指标
     - 释放数据库存储空间
     """
-    from apps.instances.models import MonitoringMetrics
     
     logger.info(f"Starting cleanup of metrics older than {days} days")
     
@@ -179,7 +178,6 @@ def update_database_statistics():
     - 遍历所有在线实例的数据库
     - 更新数据库大小和表数量
     """
-    from apps.instances.models import Database
     
     logger.info("Starting database statistics update")
     
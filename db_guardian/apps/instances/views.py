@@ -58,19 +58,18 @@ class MySQLInstanceViewSet(viewsets.ModelViewSet):
         - 普通用户：仅查看所属团队的实例
         """
         user = self.request.user
-        
-        if user.is_superuser:
-            return MySQLInstance.objects.all().select_related(
-                'team', 'created_by'
-            ).prefetch_related('databases')
-        
-        # 获取用户所属的所有团队
-        user_teams = user.teams.all()
-        return MySQLInstance.objects.filter(
-            team__in=user_teams
-        ).select_related(
+        queryset = MySQLInstance.objects.select_related(
             'team', 'created_by'
         ).prefetch_related('databases')
+        if self.action == 'list':
+            # 列表会对过期实例做健康检查，需要实例的加密凭据列；只跳过创建者的密码哈希。
+            queryset = queryset.defer('created_by__password')
+        
+        if user.is_superuser:
+            return queryset
+        
+        # 按用户所属团队过滤
+        return queryset.filter(team_id__in=user.get_team_ids())
     
     def get_serializer_class(self):
         """根据动作返回不同的序列化器"""
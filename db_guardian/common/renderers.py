@@ -0,0 +1,28 @@
+"""
+通用 DRF 渲染器
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 可选依赖
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    基于 orjson 的 JSON 渲染器
+
+    大列表响应的序列化由 C 扩展完成；orjson 无法直接处理的类型
+    （懒翻译字符串、Decimal 等）交给 DRF 默认编码器。未安装 orjson 时退回 JSONRenderer。
+    """
+
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._encoder.default, option=orjson.OPT_NON_STR_KEYS)
@@ -132,6 +132,13 @@ MYSQL_DUMP_INCLUDE_SYSTEM_DATABASES = config(
     default=False,
     cast=bool
 )
+BACKUP_GZIP_LEVEL = config('BACKUP_GZIP_LEVEL', default=1, cast=int)  # gzip 压缩级别（1-9，仅 gzip/回退路径使用，1 级 CPU 开销最低）
+BACKUP_COMPRESSION_ALGO = config('BACKUP_COMPRESSION_ALGO', default='zstd')  # 逻辑备份默认压缩算法（zstd/gzip）
+BACKUP_ZSTD_LEVEL = config('BACKUP_ZSTD_LEVEL', default=3, cast=int)  # zstd 压缩级别
+BACKUP_COMPRESSION_THREADS = config('BACKUP_COMPRESSION_THREADS', default=-1, cast=int)  # zstd 压缩线程数（-1 为全部核心，0 为单线程）
+BACKUP_STREAM_PART_SIZE_MB = config('BACKUP_STREAM_PART_SIZE_MB', default=16, cast=int)  # 直传 OSS 时的分片大小（MB）
+BACKUP_ACCEL_REDIRECT_PREFIX = config('BACKUP_ACCEL_REDIRECT_PREFIX', default='')  # 非空时本地备份下载经 X-Accel-Redirect 交给 nginx internal location 发送
+BACKUP_XSENDFILE = config('BACKUP_XSENDFILE', default=False, cast=bool)  # 为 True 时本地备份下载经 X-Sendfile 交给 Apache mod_xsendfile 发送
 
 # Aliyun OSS (optional)
 OSS_ENABLED = config('OSS_ENABLED', default=False, cast=bool)
@@ -340,3 +347,15 @@ BACKUP_STORAGE_PATH.mkdir(parents=True, exist_ok=True)
 
 # 备份文件最大保留数量（防止磁盘占满）
 BACKUP_MAX_FILES_PER_INSTANCE = config('BACKUP_MAX_FILES_PER_INSTANCE', default=50, cast=int)
+
+# 清理过期备份时并发删除文件的线程数
+BACKUP_CLEANUP_PARALLEL = config('BACKUP_CLEANUP_PARALLEL', default=16, cast=int)
+
+# 多库备份时并发执行的数据库数量
+BACKUP_DATABASE_PARALLEL = config('BACKUP_DATABASE_PARALLEL', default=4, cast=int)
+
+# 相同参数备份任务的去重锁超时时间（秒）
+BACKUP_TASK_LOCK_TIMEOUT = config('BACKUP_TASK_LOCK_TIMEOUT', default=3600, cast=int)
+
+# 策略启停后延迟同步 Celery Beat 的秒数（窗口内的多次变更合并为一次同步）
+BACKUP_BEAT_SYNC_DELAY = config('BACKUP_BEAT_SYNC_DELAY', default=1, cast=int)
@@ -954,6 +954,7 @@ async function openBackupStrategyForm(strategy = null) {
     storage_mode: strategy?.storage_mode || "default",
     storage_path: strategy?.storage_path || "",
     compress: strategy?.compress ?? true,
+    compression_algo: strategy?.compression_algo ?? "zstd",
     databases: Array.isArray(strategy?.databases) ? strategy.databases.join(",") : "",
   };
 
@@ -1009,6 +1010,12 @@ async function openBackupStrategyForm(strategy = null) {
             <option value="false" ${!data.compress ? "selected" : ""}>否</option>
           </select>
         </label>
+        <label>压缩算法
+          <select name="compression_algo">
+            <option value="zstd" ${data.compression_algo === "zstd" ? "selected" : ""}>zstd</option>
+            <option value="gzip" ${data.compression_algo === "gzip" ? "selected" : ""}>gzip</option>
+          </select>
+        </label>
       </div>
       <div class="toolbar" style="margin-top:16px;">
         <button class="primary" type="submit">保存</button>